@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark: time from process spawn to the first SSE response.
+
+Starts `python src/server.py` repeatedly and measures how long it takes until
+GET /sse returns the first event (the MCP `endpoint` event). This is what a
+rolling restart or scale-up pays before a pod can serve agents.
+
+Usage:
+    python benchmarks/cold_start.py --runs 5
+    python benchmarks/cold_start.py --backends postgres --runs 10
+    python benchmarks/cold_start.py --importtime   # also show slowest imports
+"""
+
+import argparse
+import http.client
+import json
+import os
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parent.parent
+SERVER = REPO_ROOT / "src" / "server.py"
+
+
+def wait_for_first_sse_event(port: int, deadline: float) -> float:
+    """Poll /sse until the first event arrives; return the time it arrived."""
+    while time.perf_counter() < deadline:
+        conn = http.client.HTTPConnection("127.0.0.1", port, timeout=2)
+        try:
+            conn.request("GET", "/sse", headers={"Accept": "text/event-stream"})
+            response = conn.getresponse()
+            if response.status == 200:
+                # The first event the hub sends is `endpoint` with a data: line
+                while line := response.readline():
+                    if line.startswith(b"data:"):
+                        return time.perf_counter()
+        except OSError:
+            time.sleep(0.02)
+        finally:
+            conn.close()
+    raise TimeoutError(f"No SSE response on port {port}")
+
+
+def run_once(port: int, backends: str, timeout: float, importtime_log: str = None) -> float:
+    cache_dir = tempfile.mkdtemp(prefix="mcp-bench-cache-")
+    env = {
+        **os.environ,
+        "MCP_PORT": str(port),
+        "ENABLED_BACKENDS": backends,
+        "SHARED_CACHE_PATH": os.path.join(cache_dir, "cache.sqlite3"),
+    }
+    cmd = [sys.executable]
+    if importtime_log:
+        cmd += ["-X", "importtime"]
+    cmd.append(str(SERVER))
+
+    stderr = open(importtime_log, "w") if importtime_log else subprocess.DEVNULL
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=stderr)
+    try:
+        return wait_for_first_sse_event(port, start + timeout) - start
+    finally:
+        proc.terminate()
+        try:
+            proc.wait(timeout=10)
+        except subprocess.TimeoutExpired:
+            proc.kill()
+        if importtime_log:
+            stderr.close()
+        shutil.rmtree(cache_dir, ignore_errors=True)
+
+
+def slowest_imports(log_path: str, top: int = 15) -> list:
+    """Parse `-X importtime` output into (cumulative_us, module) sorted descending."""
+    entries = []
+    with open(log_path) as f:
+        for line in f:
+            if not line.startswith("import time:") or "cumulative" in line:
+                continue
+            fields = line[len("import time:") :].split("|")
+            entries.append((int(fields[1]), fields[2].strip()))
+    entries.sort(reverse=True)
+    return entries[:top]
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--runs", type=int, default=5, help="Number of cold starts (default: 5)")
+    parser.add_argument("--port", type=int, default=18000, help="Port to start the server on")
+    parser.add_argument(
+        "--backends",
+        default="postgres,mysql,qdrant,neo4j",
+        help="ENABLED_BACKENDS for the server under test",
+    )
+    parser.add_argument("--timeout", type=float, default=60.0, help="Per-run timeout in seconds")
+    parser.add_argument("--importtime", action="store_true", help="Report the slowest imports")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    samples = [run_once(args.port, args.backends, args.timeout) for _ in range(args.runs)]
+    result = {
+        "backends": args.backends,
+        "runs": args.runs,
+        "time_to_first_sse_ms": {
+            "min": round(min(samples) * 1000, 1),
+            "median": round(statistics.median(samples) * 1000, 1),
+            "max": round(max(samples) * 1000, 1),
+        },
+    }
+
+    if args.importtime:
+        with tempfile.NamedTemporaryFile(suffix=".log", delete=False) as f:
+            log_path = f.name
+        run_once(args.port, args.backends, args.timeout, importtime_log=log_path)
+        result["slowest_imports_ms"] = {
+            module: round(us / 1000, 1) for us, module in slowest_imports(log_path)
+        }
+        os.unlink(log_path)
+
+    if args.json:
+        print(json.dumps(result, indent=2))
+        return
+
+    ttfr = result["time_to_first_sse_ms"]
+    print(f"Backends: {args.backends}")
+    print(f"Time to first SSE response over {args.runs} runs:")
+    print(f"  min {ttfr['min']} ms | median {ttfr['median']} ms | max {ttfr['max']} ms")
+    if args.importtime:
+        print("Slowest imports (cumulative):")
+        for module, ms in result["slowest_imports_ms"].items():
+            print(f"  {ms:>8.1f} ms  {module}")
+
+
+if __name__ == "__main__":
+    main()
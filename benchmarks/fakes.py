@@ -0,0 +1,484 @@
+"""
+In-process stand-ins for the four backend client libraries.
+
+`install()` registers fake `psycopg2`, `mysql.connector`, `qdrant_client` and
+`neo4j` modules in sys.modules. The hub imports backend libraries lazily
+through `import_backend()`, so installing the fakes before the first tool call
+routes every tool to them without touching src/server.py.
+
+Each backend call sleeps for `CONFIG.latency_ms` (releasing the GIL like real
+network I/O) and returns `CONFIG.rows` rows of `CONFIG.columns` string columns
+of `CONFIG.value_size` characters, so result width can be tuned independently
+of latency.
+"""
+
+import re
+import sys
+import threading
+import time
+import types
+from dataclasses import dataclass
+from typing import Any, Dict, List
+
+
+@dataclass
+class FakeConfig:
+    latency_ms: float = 1.0
+    rows: int = 100
+    columns: int = 8
+    value_size: int = 16
+    vector_size: int = 384
+
+
+CONFIG = FakeConfig()
+
+_LIMIT_RE = re.compile(r"\bLIMIT\s+(\d+)", re.IGNORECASE)
+_rows_cache: Dict[tuple, List[Dict[str, Any]]] = {}
+_rows_lock = threading.Lock()
+
+
+def _backend_call():
+    if CONFIG.latency_ms > 0:
+        time.sleep(CONFIG.latency_ms / 1000)
+
+
+def _make_rows(query: str = "") -> List[Dict[str, Any]]:
+    """Rows honouring a LIMIT in the query; generated once per configuration."""
+    key = (CONFIG.rows, CONFIG.columns, CONFIG.value_size)
+    with _rows_lock:
+        rows = _rows_cache.get(key)
+        if rows is None:
+            rows = _rows_cache[key] = [
+                {
+                    "id": i,
+                    **{
+                        f"col_{c}": f"{i}-{c}".ljust(CONFIG.value_size, "x")
+                        for c in range(CONFIG.columns)
+                    },
+                }
+                for i in range(CONFIG.rows)
+            ]
+    match = _LIMIT_RE.search(query)
+    return rows[: int(match.group(1))] if match else rows
+
+
+# =============================================================================
+# psycopg2
+# =============================================================================
+
+
+class _PgCursor:
+    def __init__(self, cursor_factory=None, name=None):
+        self.cursor_factory = cursor_factory
+        self.name = name
+        self.itersize = 2000
+        self._query = ""
+        self._rows: List[Dict[str, Any]] = []
+        self._position = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def execute(self, query, params=None):
+        self._query = str(query)
+        _backend_call()
+        upper = self._query.upper()
+        if "COUNT(" in upper:
+            self._rows = [{"count": CONFIG.rows}]
+        elif "FROM PG_DATABASE WHERE" in upper or "CREATE DATABASE" in upper:
+            self._rows = []
+        elif "FROM PG_ROLES" in upper:
+            self._rows = [{"?column?": 1}]
+        elif "SELECT UDT_NAME" in upper:
+            self._rows = [{"udt_name": "int4"}]
+        elif " AS SCORE " in upper:
+            # hybrid_search text side: ranked ids with decreasing scores
+            limit = params["limit"] if isinstance(params, dict) else CONFIG.rows
+            self._rows = [{"id": i, "score": 1 / (i + 1)} for i in range(min(limit, CONFIG.rows))]
+        elif "= ANY(" in upper:
+            wanted = {str(i) for i in params[0]}
+            self._rows = [row for row in _make_rows() if str(row["id"]) in wanted]
+        else:
+            self._rows = _make_rows(self._query)
+        self._position = 0
+
+    def fetchall(self):
+        return self._rows
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchmany(self, size=1):
+        batch = self._rows[self._position : self._position + size]
+        self._position += len(batch)
+        return batch
+
+    def close(self):
+        pass
+
+
+class _PgConnection:
+    def __init__(self, **kwargs):
+        _backend_call()
+        self.closed = 0
+        self.autocommit = False
+
+    def cursor(self, name=None, cursor_factory=None):
+        return _PgCursor(cursor_factory, name)
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        self.closed = 1
+
+
+class _PgThreadedConnectionPool:
+    def __init__(self, minconn, maxconn, **kwargs):
+        self.maxconn = maxconn
+        self._kwargs = kwargs
+        self._lock = threading.Lock()
+        self._pool = [_PgConnection(**kwargs) for _ in range(minconn)]
+        self._used: Dict[int, _PgConnection] = {}
+
+    def getconn(self):
+        with self._lock:
+            if self._pool:
+                conn = self._pool.pop()
+            elif len(self._used) < self.maxconn:
+                conn = None
+            else:
+                raise _PgPoolError("connection pool exhausted")
+        if conn is None:
+            conn = _PgConnection(**self._kwargs)
+        with self._lock:
+            self._used[id(conn)] = conn
+        return conn
+
+    def putconn(self, conn, close=False):
+        with self._lock:
+            self._used.pop(id(conn), None)
+            if not close:
+                self._pool.append(conn)
+
+
+class _PgPoolError(Exception):
+    pass
+
+
+class _PgSQL:
+    def __init__(self, template):
+        self.template = template
+
+    def format(self, *args):
+        return self.template.format(*(str(a) for a in args))
+
+
+class _PgIdentifier:
+    def __init__(self, name):
+        self.name = name
+
+    def __str__(self):
+        return f'"{self.name}"'
+
+
+class _RealDictCursor:
+    pass
+
+
+def _psycopg2_modules() -> Dict[str, types.ModuleType]:
+    psycopg2 = types.ModuleType("psycopg2")
+    psycopg2.connect = lambda **kwargs: _PgConnection(**kwargs)
+
+    extras = types.ModuleType("psycopg2.extras")
+    extras.RealDictCursor = _RealDictCursor
+
+    pool = types.ModuleType("psycopg2.pool")
+    pool.ThreadedConnectionPool = _PgThreadedConnectionPool
+    pool.PoolError = _PgPoolError
+
+    sql = types.ModuleType("psycopg2.sql")
+    sql.SQL = _PgSQL
+    sql.Identifier = _PgIdentifier
+
+    psycopg2.extras, psycopg2.pool, psycopg2.sql = extras, pool, sql
+    return {
+        "psycopg2": psycopg2,
+        "psycopg2.extras": extras,
+        "psycopg2.pool": pool,
+        "psycopg2.sql": sql,
+    }
+
+
+# =============================================================================
+# mysql.connector
+# =============================================================================
+
+
+class _MySQLError(Exception):
+    pass
+
+
+class _MySQLCursor:
+    def __init__(self, dictionary=False):
+        self._rows: List[Dict[str, Any]] = []
+        self._position = 0
+
+    def execute(self, query, params=None):
+        _backend_call()
+        upper = query.upper()
+        if upper.startswith("SHOW TABLES FROM"):
+            db_name = query.split()[-1]
+            self._rows = [{f"Tables_in_{db_name}": f"table_{i}"} for i in range(10)]
+        elif upper.startswith("DESCRIBE"):
+            self._rows = [
+                {
+                    "Field": f"col_{c}",
+                    "Type": "varchar(255)",
+                    "Null": "YES",
+                    "Key": "",
+                    "Default": None,
+                }
+                for c in range(CONFIG.columns)
+            ]
+        elif "COUNT(" in upper:
+            self._rows = [{"count": CONFIG.rows}]
+        else:
+            self._rows = _make_rows(query)
+        self._position = 0
+
+    def fetchall(self):
+        return self._rows
+
+    def fetchone(self):
+        return self._rows[0] if self._rows else None
+
+    def fetchmany(self, size=1):
+        batch = self._rows[self._position : self._position + size]
+        self._position += len(batch)
+        return batch
+
+    def close(self):
+        pass
+
+
+class _MySQLConnection:
+    unread_result = False
+
+    def __init__(self, pool=None, **kwargs):
+        _backend_call()
+        self._pool = pool
+
+    def cursor(self, dictionary=False):
+        return _MySQLCursor(dictionary)
+
+    def is_connected(self):
+        return True
+
+    def consume_results(self):
+        pass
+
+    def close(self):
+        if self._pool is not None:
+            self._pool._return(self)
+
+
+class _MySQLConnectionPool:
+    def __init__(self, pool_name=None, pool_size=5, **kwargs):
+        self._lock = threading.Lock()
+        self._idle = [_MySQLConnection(pool=self, **kwargs) for _ in range(pool_size)]
+
+    def get_connection(self):
+        with self._lock:
+            if not self._idle:
+                raise _MySQLError("Failed getting connection; pool exhausted")
+            return self._idle.pop()
+
+    def _return(self, conn):
+        with self._lock:
+            self._idle.append(conn)
+
+
+def _mysql_modules() -> Dict[str, types.ModuleType]:
+    mysql = types.ModuleType("mysql")
+    connector = types.ModuleType("mysql.connector")
+    connector.connect = lambda **kwargs: _MySQLConnection(**kwargs)
+    connector.Error = _MySQLError
+
+    pooling = types.ModuleType("mysql.connector.pooling")
+    pooling.MySQLConnectionPool = _MySQLConnectionPool
+
+    mysql.connector, connector.pooling = connector, pooling
+    return {"mysql": mysql, "mysql.connector": connector, "mysql.connector.pooling": pooling}
+
+
+# =============================================================================
+# qdrant_client
+# =============================================================================
+
+
+class _QdrantClient:
+    def __init__(self, host=None, port=None, api_key=None, **kwargs):
+        self._collections = ["documents", "memories", "affirmations"]
+
+    def get_collections(self):
+        _backend_call()
+        return types.SimpleNamespace(
+            collections=[types.SimpleNamespace(name=n) for n in self._collections]
+        )
+
+    def get_collection(self, collection_name):
+        _backend_call()
+        if collection_name not in self._collections:
+            raise ValueError(f"Collection {collection_name} not found")
+        return types.SimpleNamespace(
+            vectors_count=CONFIG.rows,
+            points_count=CONFIG.rows,
+            status="green",
+            config=types.SimpleNamespace(
+                params={"vectors": {"size": CONFIG.vector_size, "distance": "Cosine"}},
+                optimizer_config={"indexing_threshold": 20000},
+            ),
+        )
+
+    def query_points(self, collection_name, query=None, limit=10, with_payload=True, **kwargs):
+        _backend_call()
+        # Every other point, best first, so vector and text rankings partly overlap
+        points = [
+            types.SimpleNamespace(id=i, score=1 - i / (2 * CONFIG.rows), payload={"doc_id": i})
+            for i in range(0, min(2 * limit, CONFIG.rows), 2)
+        ]
+        return types.SimpleNamespace(points=points)
+
+    def scroll(
+        self,
+        collection_name,
+        scroll_filter=None,
+        limit=10,
+        offset=None,
+        with_payload=True,
+        with_vectors=False,
+        **kwargs,
+    ):
+        _backend_call()
+        start = offset or 0
+        end = min(start + limit, CONFIG.rows)
+        rows = _make_rows()
+        points = []
+        for row in rows[start:end]:
+            if with_payload is True:
+                payload = row
+            elif with_payload:
+                payload = {k: v for k, v in row.items() if k in with_payload}
+            else:
+                payload = None
+            vector = [0.1] * CONFIG.vector_size if with_vectors else None
+            points.append(types.SimpleNamespace(id=row["id"], payload=payload, vector=vector))
+        return points, (end if end < CONFIG.rows else None)
+
+
+class _QdrantFilter:
+    def __init__(self, **conditions):
+        self.conditions = conditions
+
+
+def _qdrant_modules() -> Dict[str, types.ModuleType]:
+    qdrant_client = types.ModuleType("qdrant_client")
+    qdrant_client.QdrantClient = _QdrantClient
+    models = types.ModuleType("qdrant_client.models")
+    models.Filter = _QdrantFilter
+    qdrant_client.models = models
+    return {"qdrant_client": qdrant_client, "qdrant_client.models": models}
+
+
+# =============================================================================
+# neo4j
+# =============================================================================
+
+
+class _Neo4jRecord(dict):
+    pass
+
+
+class _Neo4jResult:
+    def __init__(self, records):
+        self._records = records
+
+    def __iter__(self):
+        return iter(self._records)
+
+    def consume(self):
+        self._records = []
+
+
+class _Neo4jSession:
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+    def run(self, query, parameters=None, **kwargs):
+        _backend_call()
+        props = _make_rows(query)
+        if "type(r)" in query:
+            records = [
+                _Neo4jRecord(
+                    a=p, b=p, rel_type="RELATES_TO", start_labels=["Node"], end_labels=["Node"]
+                )
+                for p in props
+            ]
+        elif "labels(n)" in query:
+            records = [_Neo4jRecord(n=p, labels=["Node"]) for p in props]
+        else:
+            records = [_Neo4jRecord(n=p) for p in props]
+        return _Neo4jResult(records)
+
+    def begin_transaction(self, **kwargs):
+        return _Neo4jTransaction(self)
+
+    def close(self):
+        pass
+
+
+class _Neo4jTransaction:
+    def __init__(self, session):
+        self.run = session.run
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class _Neo4jDriver:
+    def __init__(self, uri, auth=None, **kwargs):
+        pass
+
+    def session(self, **kwargs):
+        return _Neo4jSession()
+
+    def verify_connectivity(self):
+        _backend_call()
+
+    def close(self):
+        pass
+
+
+def _neo4j_modules() -> Dict[str, types.ModuleType]:
+    neo4j = types.ModuleType("neo4j")
+    neo4j.GraphDatabase = types.SimpleNamespace(driver=_Neo4jDriver)
+    return {"neo4j": neo4j}
+
+
+def install() -> None:
+    """Register the fake backend modules (call before the first tool runs)."""
+    for factory in (_psycopg2_modules, _mysql_modules, _qdrant_modules, _neo4j_modules):
+        sys.modules.update(factory())
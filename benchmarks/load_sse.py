@@ -0,0 +1,326 @@
+#!/usr/bin/env python3
+"""
+Multi-session SSE load generator for end-to-end hub capacity testing.
+
+Opens N concurrent MCP client sessions against a running hub over the SSE
+transport, replays a weighted mix of tool calls for a fixed duration and
+reports throughput, tail latency and error rates per tool. When the server
+PID is known (or the hub is spawned by this script) its CPU and RSS are
+sampled over time, so replica counts and pool sizes can be set from
+measurements.
+
+Usage:
+    # Against a hub that is already running
+    python benchmarks/load_sse.py --url http://localhost:8000/sse --sessions 50 --server-pid 1234
+
+    # Spawn a local hub backed by the in-process fakes (no databases needed)
+    python benchmarks/load_sse.py --spawn --fake-backends --sessions 100 --duration 60
+
+    # Custom tool mix: {"postgres_query": {"weight": 3, "args": {"sql": "SELECT 1"}}, ...}
+    python benchmarks/load_sse.py --spawn --fake-backends --mix mix.json --json
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import random
+import subprocess
+import sys
+import tempfile
+import time
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+import psutil
+from mcp import ClientSession
+from mcp.client.sse import sse_client
+
+BENCH_DIR = Path(__file__).resolve().parent
+SRC_DIR = BENCH_DIR.parent / "src"
+
+DEFAULT_MIX: Dict[str, Dict[str, Any]] = {
+    "health_check": {"weight": 1, "args": {}},
+    "list_services": {"weight": 1, "args": {}},
+    "postgres_query": {"weight": 4, "args": {"sql": "SELECT * FROM bench_table", "limit": 100}},
+    "mysql_query": {"weight": 2, "args": {"sql": "SELECT * FROM bench_table", "limit": 100}},
+    "qdrant_collection_info": {"weight": 1, "args": {"collection": "documents"}},
+    "neo4j_query": {"weight": 2, "args": {"cypher": "MATCH (n) RETURN n", "limit": 100}},
+}
+
+# Starts src/server.py with the benchmark fakes installed in place of the client libraries
+_FAKE_LAUNCHER = (
+    "import runpy, sys; sys.path[:0] = [{bench!r}, {src!r}]; "
+    "import fakes; fakes.CONFIG.latency_ms = {latency}; fakes.install(); "
+    "runpy.run_path({server!r}, run_name='__main__')"
+)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class Recorder:
+    """Collects per-call latencies and errors, and per-interval completions."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.errors: Dict[str, int] = defaultdict(int)
+        self.session_failures = 0
+        self.completed_in_interval = 0
+
+    def record(self, tool: str, latency: float, failed: bool):
+        self.latencies[tool].append(latency)
+        self.completed_in_interval += 1
+        if failed:
+            self.errors[tool] += 1
+
+
+def tool_failed(result: Any) -> bool:
+    """
+    Whether a CallToolResult is a failure.
+
+    Hub tools report most failures in their result dict rather than raising, so
+    besides isError the JSON text content is checked for `success: false` or an
+    `error` key (the same rule as tool_bench.run_calls).
+    """
+    if getattr(result, "isError", False):
+        return True
+    payloads = [getattr(result, "structuredContent", None)]
+    for item in getattr(result, "content", None) or []:
+        try:
+            payloads.append(json.loads(getattr(item, "text", None) or ""))
+        except ValueError:
+            continue
+    return any(
+        isinstance(payload, dict) and (payload.get("success") is False or "error" in payload)
+        for payload in payloads
+    )
+
+
+async def run_session(
+    url: str,
+    mix: Dict[str, Dict[str, Any]],
+    deadline: float,
+    recorder: Recorder,
+    think_time: float,
+    rng: random.Random,
+):
+    """One agent: keep a session open and call tools from the mix until the deadline."""
+    tools = list(mix)
+    weights = [mix[t].get("weight", 1) for t in tools]
+    try:
+        async with sse_client(url, timeout=30) as streams:
+            async with ClientSession(streams[0], streams[1]) as session:
+                await session.initialize()
+                while time.perf_counter() < deadline:
+                    tool = rng.choices(tools, weights)[0]
+                    start = time.perf_counter()
+                    try:
+                        result = await session.call_tool(tool, mix[tool].get("args", {}))
+                        failed = tool_failed(result)
+                    except Exception:
+                        failed = True
+                    recorder.record(tool, time.perf_counter() - start, failed)
+                    if think_time:
+                        await asyncio.sleep(think_time)
+    except Exception:
+        recorder.session_failures += 1
+
+
+async def sample_server(
+    pid: Optional[int], recorder: Recorder, deadline: float, interval: float
+) -> List[dict]:
+    """Sample server CPU/RSS (including worker processes) and call rate over time."""
+    samples = []
+    processes = []
+    if pid:
+        parent = psutil.Process(pid)
+        processes = [parent, *parent.children(recursive=True)]
+        for p in processes:
+            p.cpu_percent(None)
+
+    start = time.perf_counter()
+    while time.perf_counter() < deadline:
+        await asyncio.sleep(interval)
+        sample = {
+            "t": round(time.perf_counter() - start, 1),
+            "calls_per_s": round(recorder.completed_in_interval / interval, 1),
+        }
+        recorder.completed_in_interval = 0
+        if processes:
+            try:
+                sample["cpu_percent"] = round(sum(p.cpu_percent(None) for p in processes), 1)
+                sample["rss_mb"] = round(sum(p.memory_info().rss for p in processes) / 2**20, 1)
+            except psutil.NoSuchProcess:
+                pass
+        samples.append(sample)
+    return samples
+
+
+def spawn_server(
+    port: int, fake_backends: bool, latency_ms: float, cache_path: str
+) -> subprocess.Popen:
+    env = {**os.environ, "MCP_PORT": str(port), "SHARED_CACHE_PATH": cache_path}
+    if fake_backends:
+        code = _FAKE_LAUNCHER.format(
+            bench=str(BENCH_DIR),
+            src=str(SRC_DIR),
+            latency=latency_ms,
+            server=str(SRC_DIR / "server.py"),
+        )
+        cmd = [sys.executable, "-c", code]
+    else:
+        cmd = [sys.executable, str(SRC_DIR / "server.py")]
+    return subprocess.Popen(cmd, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+async def wait_until_ready(url: str, timeout: float = 60.0):
+    deadline = time.perf_counter() + timeout
+    while time.perf_counter() < deadline:
+        try:
+            async with sse_client(url, timeout=2) as streams:
+                async with ClientSession(streams[0], streams[1]) as session:
+                    await session.initialize()
+                    return
+        except Exception:
+            await asyncio.sleep(0.25)
+    raise TimeoutError(f"Hub at {url} did not become ready")
+
+
+async def run_load(args, mix: Dict[str, Dict[str, Any]], pid: Optional[int]) -> dict:
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    start = time.perf_counter()
+    deadline = start + args.ramp_up + args.duration
+
+    sessions = []
+    sampler = asyncio.create_task(sample_server(pid, recorder, deadline, args.sample_interval))
+    for _ in range(args.sessions):
+        session_rng = random.Random(rng.random())
+        sessions.append(
+            asyncio.create_task(
+                run_session(args.url, mix, deadline, recorder, args.think_time, session_rng)
+            )
+        )
+        if args.ramp_up:
+            await asyncio.sleep(args.ramp_up / args.sessions)
+
+    await asyncio.gather(*sessions)
+    timeline = await sampler
+    elapsed = time.perf_counter() - start
+
+    per_tool = {}
+    all_latencies = []
+    for tool, latencies in sorted(recorder.latencies.items()):
+        all_latencies.extend(latencies)
+        per_tool[tool] = {
+            "calls": len(latencies),
+            "errors": recorder.errors[tool],
+            "error_rate": round(recorder.errors[tool] / len(latencies), 4),
+            "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+            "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+            "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        }
+
+    total_errors = sum(recorder.errors.values())
+    return {
+        "url": args.url,
+        "sessions": args.sessions,
+        "duration_s": round(elapsed, 1),
+        "total_calls": len(all_latencies),
+        "throughput_calls_per_s": round(len(all_latencies) / elapsed, 1),
+        "error_rate": round(total_errors / len(all_latencies), 4) if all_latencies else 0.0,
+        "session_failures": recorder.session_failures,
+        "p50_ms": round(percentile(all_latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(all_latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(all_latencies, 99) * 1000, 2),
+        "per_tool": per_tool,
+        "timeline": timeline,
+    }
+
+
+def print_report(report: dict):
+    print(f"Hub: {report['url']}  sessions: {report['sessions']}  ({report['duration_s']}s)")
+    print(
+        f"Throughput: {report['throughput_calls_per_s']} calls/s  "
+        f"errors: {report['error_rate']:.2%}  failed sessions: {report['session_failures']}"
+    )
+    print(
+        f"Latency: p50 {report['p50_ms']} ms | p95 {report['p95_ms']} ms | "
+        f"p99 {report['p99_ms']} ms"
+    )
+    print()
+    print(f"{'tool':<28} {'calls':>7} {'err %':>7} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}")
+    for tool, r in report["per_tool"].items():
+        print(
+            f"{tool:<28} {r['calls']:>7} {r['error_rate'] * 100:>7.2f} "
+            f"{r['p50_ms']:>9} {r['p95_ms']:>9} {r['p99_ms']:>9}"
+        )
+    print()
+    print(f"{'t (s)':>7} {'calls/s':>9} {'cpu %':>7} {'rss MB':>8}")
+    for s in report["timeline"]:
+        cpu, rss = s.get("cpu_percent", "-"), s.get("rss_mb", "-")
+        print(f"{s['t']:>7} {s['calls_per_s']:>9} {cpu:>7} {rss:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--url", default="http://127.0.0.1:8000/sse", help="Hub SSE endpoint")
+    parser.add_argument("--sessions", type=int, default=20, help="Concurrent MCP sessions")
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds at full load")
+    parser.add_argument("--ramp-up", type=float, default=5.0, help="Seconds to open all sessions")
+    parser.add_argument("--think-time", type=float, default=0.0, help="Pause between calls (s)")
+    parser.add_argument("--mix", help="JSON file mapping tool -> {weight, args}")
+    parser.add_argument("--server-pid", type=int, help="Sample CPU/RSS of this process")
+    parser.add_argument("--spawn", action="store_true", help="Start a local hub for the run")
+    parser.add_argument(
+        "--fake-backends", action="store_true", help="With --spawn: use benchmarks/fakes.py"
+    )
+    parser.add_argument(
+        "--fake-latency-ms", type=float, default=2.0, help="Fake backend latency (--spawn only)"
+    )
+    parser.add_argument("--sample-interval", type=float, default=1.0, help="Sampling period (s)")
+    parser.add_argument("--seed", type=int, default=42, help="Seed for the tool mix")
+    parser.add_argument("--json", action="store_true", help="Print the report as JSON")
+    args = parser.parse_args()
+
+    mix = DEFAULT_MIX
+    if args.mix:
+        with open(args.mix) as f:
+            mix = json.load(f)
+
+    server = None
+    pid = args.server_pid
+    cache_dir = tempfile.TemporaryDirectory(prefix="mcp-bench-cache-")
+    if args.spawn:
+        port = int(args.url.split(":")[-1].split("/")[0])
+        cache_path = os.path.join(cache_dir.name, "cache.sqlite3")
+        server = spawn_server(port, args.fake_backends, args.fake_latency_ms, cache_path)
+        pid = server.pid
+
+    try:
+        if server is not None:
+            asyncio.run(wait_until_ready(args.url))
+        report = asyncio.run(run_load(args, mix, pid))
+    finally:
+        if server is not None:
+            server.terminate()
+            server.wait(timeout=10)
+        cache_dir.cleanup()
+
+    if args.json:
+        print(json.dumps(report, indent=2))
+    else:
+        print_report(report)
+
+
+if __name__ == "__main__":
+    main()
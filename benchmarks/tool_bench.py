@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Tool-layer benchmark against in-process backend stand-ins.
+
+Runs every tool registered by src/server.py against the fakes in
+benchmarks/fakes.py (no Postgres, MySQL, Qdrant or Neo4j needed) and reports
+per-tool throughput, p50/p99 latency and peak memory at several concurrency
+levels. Results can be saved and compared against a baseline to catch
+regressions.
+
+Pools keep their deployed sizes (POSTGRES_POOL_MAX, MYSQL_POOL_SIZE), so
+concurrency levels above them measure queueing for a connection. Calls that
+fail because a pool is exhausted are counted separately from other errors.
+
+Usage:
+    python benchmarks/tool_bench.py
+    python benchmarks/tool_bench.py --concurrency 1,8,32 --latency-ms 2 --rows 500 --columns 20
+    python benchmarks/tool_bench.py --tools postgres_query,neo4j_query --save baseline.json
+    python benchmarks/tool_bench.py --compare baseline.json --threshold 0.2
+"""
+
+import argparse
+import json
+import os
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, List
+
+BENCH_DIR = Path(__file__).resolve().parent
+sys.path.insert(0, str(BENCH_DIR))
+sys.path.insert(0, str(BENCH_DIR.parent / "src"))
+
+import fakes  # noqa: E402
+
+# Arguments used for each tool; tools not listed here are called without arguments
+TOOL_ARGS: Dict[str, Dict[str, Any]] = {
+    "postgres_query": {"sql": "SELECT * FROM bench_table", "limit": 1000},
+    "postgres_create_database": {"database_name": "bench_db"},
+    "postgres_describe_table": {"table_name": "bench_table"},
+    "mysql_query": {"sql": "SELECT * FROM bench_table", "limit": 1000},
+    "mysql_describe_table": {"table_name": "bench_table"},
+    "qdrant_search": {"collection": "documents", "query_text": "benchmark"},
+    "qdrant_collection_info": {"collection": "documents"},
+    "qdrant_scroll": {"collection": "documents", "limit": 1000},
+    "neo4j_query": {"cypher": "MATCH (n) RETURN n", "limit": 1000},
+    "multi_query": {
+        "requests": [
+            {"tool": "postgres_query", "args": {"sql": "SELECT * FROM bench_table"}},
+            {"tool": "mysql_query", "args": {"sql": "SELECT * FROM bench_table"}},
+            {"tool": "qdrant_collection_info", "args": {"collection": "documents"}},
+            {"tool": "neo4j_query", "args": {"cypher": "MATCH (n) RETURN n"}},
+        ]
+    },
+    "federated_join": {
+        "left_sql": "SELECT * FROM bench_table",
+        "right_sql": "SELECT * FROM bench_table",
+        "left_key": "id",
+        "limit": 1000,
+    },
+    "hybrid_search": {
+        "query_text": "benchmark",
+        "collection": "documents",
+        "table": "bench_table",
+        "query_vector": [0.1] * 384,
+        "limit": 20,
+    },
+}
+
+
+# Error messages raised when no pooled connection could be had (psycopg2,
+# mysql.connector, or the hub's POOL_TIMEOUT wait)
+POOL_ERROR_MARKERS = ("pool exhausted", "(pool size")
+
+
+def is_pool_error(result: Any) -> bool:
+    error = result.get("error") if isinstance(result, dict) else None
+    return isinstance(error, str) and any(marker in error for marker in POOL_ERROR_MARKERS)
+
+
+def percentile(values: List[float], pct: float) -> float:
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def run_calls(fn: Callable, kwargs: dict, iterations: int, concurrency: int):
+    """
+    Call fn `iterations` times from `concurrency` threads.
+
+    Returns:
+        (latencies, errors, pool_errors, wall) - errors excludes pool errors
+    """
+
+    def call(_):
+        start = time.perf_counter()
+        result = fn(**kwargs)
+        elapsed = time.perf_counter() - start
+        failed = isinstance(result, dict) and (result.get("success") is False or "error" in result)
+        pool_error = is_pool_error(result)
+        return elapsed, failed and not pool_error, pool_error
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        start = time.perf_counter()
+        outcomes = list(executor.map(call, range(iterations)))
+        wall = time.perf_counter() - start
+
+    return (
+        [o[0] for o in outcomes],
+        sum(o[1] for o in outcomes),
+        sum(o[2] for o in outcomes),
+        wall,
+    )
+
+
+def bench_tool(name: str, fn: Callable, iterations: int, concurrency: int) -> Dict[str, Any]:
+    kwargs = TOOL_ARGS.get(name, {})
+    run_calls(fn, kwargs, min(iterations, 10), concurrency)  # warm pools and caches
+
+    latencies, errors, pool_errors, wall = run_calls(fn, kwargs, iterations, concurrency)
+
+    # Separate pass for memory: tracemalloc slows every allocation down
+    tracemalloc.start()
+    run_calls(fn, kwargs, iterations, concurrency)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    return {
+        "tool": name,
+        "concurrency": concurrency,
+        "iterations": iterations,
+        "throughput_ops": round(iterations / wall, 1),
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "peak_kib": round(peak / 1024, 1),
+        "errors": errors,
+        "pool_errors": pool_errors,
+    }
+
+
+def compare(results: List[dict], baseline_path: str, threshold: float) -> List[str]:
+    """Return regressions where throughput dropped or p50/p99 rose by more than threshold."""
+    with open(baseline_path) as f:
+        baseline = {(r["tool"], r["concurrency"]): r for r in json.load(f)["results"]}
+
+    regressions = []
+    for r in results:
+        base = baseline.get((r["tool"], r["concurrency"]))
+        if base is None:
+            continue
+        if r["throughput_ops"] < base["throughput_ops"] * (1 - threshold):
+            regressions.append(
+                f"{r['tool']} @{r['concurrency']}: throughput "
+                f"{base['throughput_ops']} -> {r['throughput_ops']} ops/s"
+            )
+        for key in ("p50_ms", "p99_ms"):
+            if r[key] > base[key] * (1 + threshold):
+                regressions.append(
+                    f"{r['tool']} @{r['concurrency']}: {key} {base[key]} -> {r[key]}"
+                )
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument("--concurrency", default="1,4,16", help="Comma-separated levels")
+    parser.add_argument("--iterations", type=int, default=200, help="Calls per tool per level")
+    parser.add_argument("--tools", help="Comma-separated tool names (default: all)")
+    parser.add_argument("--latency-ms", type=float, default=1.0, help="Fake backend latency")
+    parser.add_argument("--rows", type=int, default=100, help="Rows returned by fake backends")
+    parser.add_argument("--columns", type=int, default=8, help="Columns per fake row")
+    parser.add_argument("--value-size", type=int, default=16, help="Characters per fake value")
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument(
+        "--threshold", type=float, default=0.2, help="Allowed regression ratio (default: 0.2)"
+    )
+    args = parser.parse_args()
+
+    levels = [int(c) for c in args.concurrency.split(",")]
+
+    # Measure the backend path, not shared cache hits (set SCHEMA_CACHE_TTL to include them)
+    os.environ.setdefault("SCHEMA_CACHE_TTL", "0")
+    # Never read entries left behind by a hub or an earlier run
+    cache_dir = tempfile.TemporaryDirectory(prefix="mcp-bench-cache-")
+    os.environ.setdefault("SHARED_CACHE_PATH", os.path.join(cache_dir.name, "cache.sqlite3"))
+
+    fakes.CONFIG.latency_ms = args.latency_ms
+    fakes.CONFIG.rows = args.rows
+    fakes.CONFIG.columns = args.columns
+    fakes.CONFIG.value_size = args.value_size
+    fakes.install()
+
+    import server
+
+    tool_names = ["health_check", "list_services", "query_stats"]
+    for tools in server.BACKEND_TOOLS.values():
+        tool_names.extend(tools)
+    tool_names.extend(server.CROSS_BACKEND_TOOLS)
+    if args.tools:
+        wanted = args.tools.split(",")
+        unknown = set(wanted) - set(tool_names)
+        if unknown:
+            parser.error(f"Unknown tool(s): {', '.join(sorted(unknown))}")
+        tool_names = wanted
+
+    print(
+        f"Pools: postgres max {server.POSTGRES_POOL_MAX}, mysql {server.MYSQL_POOL_SIZE}, "
+        f"wait up to {server.POOL_TIMEOUT:g}s\n"
+    )
+    results = []
+    header = (
+        f"{'tool':<28} {'conc':>5} {'ops/s':>10} {'p50 ms':>9} {'p99 ms':>9} "
+        f"{'peak KiB':>10} {'err':>5} {'pool err':>9}"
+    )
+    print(header)
+    print("-" * len(header))
+    for name in tool_names:
+        # FastMCP versions differ in whether @mcp.tool() returns the function or a Tool
+        tool = getattr(server, name)
+        fn = getattr(tool, "fn", tool)
+        for concurrency in levels:
+            r = bench_tool(name, fn, args.iterations, concurrency)
+            results.append(r)
+            print(
+                f"{name:<28} {concurrency:>5} {r['throughput_ops']:>10} {r['p50_ms']:>9} "
+                f"{r['p99_ms']:>9} {r['peak_kib']:>10} {r['errors']:>5} {r['pool_errors']:>9}"
+            )
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump({"config": vars(args), "results": results}, f, indent=2)
+
+    if args.compare:
+        regressions = compare(results, args.compare, args.threshold)
+        if regressions:
+            print(f"\n❌ {len(regressions)} regression(s) beyond {args.threshold:.0%}:")
+            for line in regressions:
+                print(f"   • {line}")
+            sys.exit(1)
+        print(f"\n✅ No regressions beyond {args.threshold:.0%}")
+
+
+if __name__ == "__main__":
+    main()
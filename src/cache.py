@@ -0,0 +1,176 @@
+"""
+Cross-process cache for schema metadata and tool results.
+
+With WORKERS > 1 every worker process has its own connection pools, but they
+all share this cache: a SQLite database on local disk (WAL mode, so readers
+never block each other). Catalog data fetched by one worker is served to the
+others without another round trip to the backend.
+
+Entries are JSON-encoded tool results keyed by tool name, a hash of the
+backend connection settings and the arguments, and expire after a
+per-namespace TTL. Only successful results are cached.
+
+Configuration (environment variables):
+- SHARED_CACHE_PATH: SQLite file shared by all workers (default: a file private
+  to this deployment; with WORKERS > 1 server.py creates one in a temporary
+  directory and passes it to the workers)
+- SCHEMA_CACHE_TTL: seconds to cache list/describe tools (default: 60 with
+  WORKERS > 1, otherwise 0; 0 disables)
+- RESULT_CACHE_TTL: seconds to cache query tool results (default: 0, disabled)
+"""
+
+import atexit
+import functools
+import hashlib
+import inspect
+import json
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from typing import Any, Callable, Optional
+
+from metrics import cache_lookup
+
+# With one process there is nobody to share with, so schema caching is opt-in;
+# with several workers it saves each of them fetching the same catalog data
+_MULTI_WORKER = int(os.getenv("WORKERS", "1")) > 1
+
+SCHEMA_CACHE_TTL = float(os.getenv("SCHEMA_CACHE_TTL", "60" if _MULTI_WORKER else "0"))
+RESULT_CACHE_TTL = float(os.getenv("RESULT_CACHE_TTL", "0"))
+
+# Settings that identify the backend a cached result came from
+BACKEND_SETTINGS = {
+    "postgres": ("POSTGRES_HOST", "POSTGRES_PORT", "POSTGRES_DB", "POSTGRES_USER"),
+    "mysql": ("MYSQL_HOST", "MYSQL_PORT", "MYSQL_DATABASE", "MYSQL_USER"),
+    "qdrant": ("QDRANT_HOST", "QDRANT_PORT"),
+    "neo4j": ("NEO4J_URI", "NEO4J_USER"),
+}
+
+# Expired rows are purged on write at most this often (seconds)
+PURGE_INTERVAL = 60.0
+
+
+class SharedCache:
+    """TTL key/value store in a SQLite file, safe across threads and processes."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._local = threading.local()
+        self._last_purge = 0.0
+
+    def _connection(self) -> sqlite3.Connection:
+        # sqlite3 connections can't be shared between threads; keep one per thread
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                "key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            self._local.conn = conn
+        return conn
+
+    def get(self, key: str) -> Optional[Any]:
+        row = (
+            self._connection()
+            .execute("SELECT value, expires_at FROM cache WHERE key = ?", (key,))
+            .fetchone()
+        )
+        if row is None or row[1] < time.time():
+            return None
+        return json.loads(row[0])
+
+    def set(self, key: str, value: Any, ttl: float) -> None:
+        now = time.time()
+        conn = self._connection()
+        conn.execute(
+            "INSERT OR REPLACE INTO cache (key, value, expires_at) VALUES (?, ?, ?)",
+            (key, json.dumps(value, default=str), now + ttl),
+        )
+        if now - self._last_purge > PURGE_INTERVAL:
+            self._last_purge = now
+            conn.execute("DELETE FROM cache WHERE expires_at < ?", (now,))
+
+    def invalidate(self, prefix: str = "") -> int:
+        """Drop entries whose key starts with prefix (all entries by default)."""
+        escaped = prefix.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+        cursor = self._connection().execute(
+            "DELETE FROM cache WHERE key LIKE ? ESCAPE '\\'", (f"{escaped}%",)
+        )
+        return cursor.rowcount
+
+
+def _process_cache_path() -> str:
+    """SQLite file private to this process, removed when it exits."""
+    path = os.path.join(tempfile.gettempdir(), f"mcp-hub-cache-{os.getpid()}.sqlite3")
+
+    def remove():
+        for suffix in ("", "-wal", "-shm"):
+            try:
+                os.remove(path + suffix)
+            except OSError:
+                pass
+
+    atexit.register(remove)
+    return path
+
+
+SHARED_CACHE = SharedCache(os.getenv("SHARED_CACHE_PATH") or _process_cache_path())
+
+
+def backend_identity(backend: str) -> str:
+    """Short hash of a backend's connection settings (host, port, database, user)."""
+    settings = {name: os.getenv(name) for name in BACKEND_SETTINGS[backend]}
+    digest = hashlib.sha256(json.dumps(settings, sort_keys=True).encode())
+    return f"{backend}@{digest.hexdigest()[:12]}"
+
+
+def cached(ttl: float, backend: str) -> Callable[[Callable[..., dict]], Callable[..., dict]]:
+    """
+    Serve a tool's successful results from SHARED_CACHE for `ttl` seconds.
+
+    The key is the tool name, the backend's identity (see backend_identity) and
+    the bound arguments (defaults applied), so `postgres_list_tables()` and
+    `postgres_list_tables(schema="public")` share an entry while hubs pointed at
+    different databases never do. Cache hits are returned with `"cached": True`.
+    A TTL of 0 returns the function unchanged.
+    """
+
+    def decorator(fn):
+        if ttl <= 0:
+            return fn
+
+        signature = inspect.signature(fn)
+        namespace = fn.__name__
+        identity = backend_identity(backend)
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = json.dumps(bound.arguments, sort_keys=True, default=str)
+            key = f"{namespace}:{identity}:{arguments}"
+
+            try:
+                hit = SHARED_CACHE.get(key)
+            except sqlite3.Error:
+                hit = None  # a broken cache must never break the tool
+            cache_lookup(namespace, hit is not None)
+            if hit is not None:
+                return {**hit, "cached": True}
+
+            result = fn(*args, **kwargs)
+            if isinstance(result, dict) and result.get("success") is True:
+                try:
+                    SHARED_CACHE.set(key, result, ttl)
+                except sqlite3.Error as e:
+                    print(f"⚠️  Shared cache write failed for {namespace}: {e}")
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,127 @@
+"""
+Response compression for the hub's HTTP transports.
+
+`CompressionMiddleware` is a pure ASGI middleware that compresses complete
+(non-streaming) responses such as streamable-HTTP JSON replies with zstd or
+gzip, depending on the client's Accept-Encoding. Server-sent event streams are
+passed through untouched so SSE sessions keep flushing events immediately.
+
+zstd is used only when the optional `zstandard` package is installed
+(`uv sync --extra compression`); gzip is always available.
+"""
+
+import gzip
+from typing import List, Optional, Tuple
+
+try:
+    import zstandard
+except ImportError:  # optional dependency
+    zstandard = None
+
+# Content types worth compressing (tool results are JSON)
+COMPRESSIBLE_TYPES = ("application/json", "text/plain", "text/html")
+
+
+def supported_encodings() -> List[str]:
+    """Encodings this server can produce, in order of preference."""
+    return ["zstd", "gzip"] if zstandard is not None else ["gzip"]
+
+
+def negotiate_encoding(accept_encoding: str) -> Optional[str]:
+    """Pick the preferred supported encoding the client accepts (q=0 means refused)."""
+    accepted = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        if params.strip().startswith("q="):
+            try:
+                q = float(params.strip()[2:])
+            except ValueError:
+                q = 0.0
+        if name:
+            accepted[name.strip().lower()] = q
+
+    for encoding in supported_encodings():
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+
+def compress(body: bytes, encoding: str, level: int) -> bytes:
+    if encoding == "zstd":
+        return zstandard.ZstdCompressor(level=level).compress(body)
+    return gzip.compress(body, compresslevel=level)
+
+
+class CompressionMiddleware:
+    """Compress complete responses of at least `minimum_size` bytes."""
+
+    def __init__(self, app, minimum_size: int = 1024, gzip_level: int = 6, zstd_level: int = 3):
+        self.app = app
+        self.minimum_size = minimum_size
+        self.levels = {"gzip": gzip_level, "zstd": zstd_level}
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        headers = dict(scope.get("headers") or [])
+        encoding = negotiate_encoding(headers.get(b"accept-encoding", b"").decode("latin-1"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        body_parts: List[bytes] = []
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+
+            if message["type"] == "http.response.start":
+                if self._should_skip(message.get("headers", [])):
+                    passthrough = True
+                    await send(message)
+                else:
+                    start_message = message
+                return
+
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+
+            body_parts.append(message.get("body", b""))
+            if message.get("more_body", False):
+                return
+
+            body = b"".join(body_parts)
+            if len(body) < self.minimum_size:
+                await send(start_message)
+                await send({"type": "http.response.body", "body": body})
+                return
+
+            compressed = compress(body, encoding, self.levels[encoding])
+            response_headers = [
+                (k, v)
+                for k, v in start_message.get("headers", [])
+                if k.lower() not in (b"content-length", b"content-encoding")
+            ]
+            response_headers += [
+                (b"content-encoding", encoding.encode()),
+                (b"content-length", str(len(compressed)).encode()),
+                (b"vary", b"Accept-Encoding"),
+            ]
+            await send({**start_message, "headers": response_headers})
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
+
+    @staticmethod
+    def _should_skip(headers: List[Tuple[bytes, bytes]]) -> bool:
+        """Skip event streams, already-encoded bodies and non-text content."""
+        header_map = {k.decode("latin-1").lower(): v.decode("latin-1").lower() for k, v in headers}
+        if "content-encoding" in header_map:
+            return True
+        content_type = header_map.get("content-type", "")
+        return not content_type.startswith(COMPRESSIBLE_TYPES)
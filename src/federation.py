@@ -0,0 +1,267 @@
+"""
+Hash join of row streams from different backends (used by federated_join).
+
+Rows are dicts as returned by RealDictCursor / dictionary cursors. The join
+builds a hash table on one side and streams the other side through it. When
+the build side grows past the memory limit, both sides are hash-partitioned
+into temporary files (a grace hash join) and joined one partition at a time,
+so memory stays bounded by roughly one partition of the build side.
+"""
+
+import os
+import pickle
+import sys
+import tempfile
+from itertools import chain, islice
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+JOIN_TYPES = ("inner", "left")
+
+Row = Dict[str, Any]
+Key = Tuple[Any, ...]
+
+
+def row_key(row: Row, columns: Sequence[str]) -> Optional[Key]:
+    """Join key of a row; None if any key column is NULL (NULL never matches)."""
+    try:
+        key = tuple(row[column] for column in columns)
+    except KeyError as e:
+        raise ValueError(f"Join key column {e} is not in the result rows") from None
+    return None if any(value is None for value in key) else key
+
+
+def row_size(row: Row) -> int:
+    """Approximate in-memory size of a row in bytes."""
+    return sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row.values())
+
+
+def merge_rows(left: Row, right: Optional[Row]) -> Row:
+    """Combine a left and right row; right columns that clash get a `_right` suffix."""
+    merged = dict(left)
+    if right:
+        for column, value in right.items():
+            merged[f"{column}_right" if column in left else column] = value
+    return merged
+
+
+def pick_build_side(
+    left_batches: Iterable[List[Row]], right_batches: Iterable[List[Row]], memory_limit: int
+) -> Tuple[str, Iterator[Row], Iterator[Row]]:
+    """
+    Read both batch streams alternately and build on the side that ends first.
+
+    Neither side needs to be counted up front: the first stream to run out is
+    the smaller one. If both are still going once memory_limit bytes are
+    buffered, the left side is used (HashJoin spills it as needed).
+
+    Returns:
+        (build_side, build_rows, probe_rows) - rows already read are replayed
+        ahead of the rest of each stream
+    """
+    streams = {"left": iter(left_batches), "right": iter(right_batches)}
+    buffered: Dict[str, List[List[Row]]] = {"left": [], "right": []}
+
+    def rows(side: str) -> Iterator[Row]:
+        return chain(chain.from_iterable(buffered[side]), chain.from_iterable(streams[side]))
+
+    def count(side: str) -> int:
+        return sum(len(batch) for batch in buffered[side])
+
+    size = 0
+    while size <= memory_limit:
+        for side, other in (("left", "right"), ("right", "left")):
+            batch = next(streams[side], None)
+            if batch is None:
+                # Batches are coarse: if the other side fits in what was already
+                # read and is done too, it is the smaller one
+                if count(other) < count(side):
+                    peek = next(streams[other], None)
+                    if peek is None:
+                        return other, rows(other), rows(side)
+                    buffered[other].append(peek)
+                return side, rows(side), rows(other)
+            buffered[side].append(batch)
+            size += sum(row_size(row) for row in batch)
+    return "left", rows("left"), rows("right")
+
+
+class HashJoin:
+    """
+    Equi-join with an in-memory hash table that spills to disk past memory_limit.
+
+    Usage:
+        join = HashJoin(["id"], ["user_id"], build_side="left")
+        join.add(build_rows)
+        for row in chain(join.probe(probe_rows), join.finish()):
+            ...
+        join.close()
+    """
+
+    def __init__(
+        self,
+        build_keys: Sequence[str],
+        probe_keys: Sequence[str],
+        build_side: str = "left",
+        join_type: str = "inner",
+        memory_limit: int = 64 * 2**20,
+        spill_dir: Optional[str] = None,
+        partitions: int = 16,
+    ):
+        if join_type not in JOIN_TYPES:
+            raise ValueError(f"join_type must be one of: {', '.join(JOIN_TYPES)}")
+        self.build_keys = build_keys
+        self.probe_keys = probe_keys
+        self.build_side = build_side
+        self.join_type = join_type
+        self.memory_limit = memory_limit
+        self.spill_dir = spill_dir
+        self.partitions = partitions
+
+        self.table: Dict[Optional[Key], List[Row]] = {}
+        self.matched: set = set()
+        self.memory_bytes = 0
+        self.build_rows = 0
+        self.probe_rows = 0
+        self._tmpdir: Optional[tempfile.TemporaryDirectory] = None
+        self._build_files: List = []
+        self._probe_files: List = []
+
+    @property
+    def spilled(self) -> bool:
+        return self._tmpdir is not None
+
+    @property
+    def _keep_unmatched_build(self) -> bool:
+        return self.join_type == "left" and self.build_side == "left"
+
+    @property
+    def _keep_unmatched_probe(self) -> bool:
+        return self.join_type == "left" and self.build_side == "right"
+
+    def _emit(self, build_row: Optional[Row], probe_row: Optional[Row]) -> Row:
+        if self.build_side == "left":
+            return merge_rows(build_row, probe_row)
+        return merge_rows(probe_row, build_row)
+
+    def add(self, rows: Iterable[Row]) -> None:
+        """Add build-side rows, spilling to disk once memory_limit is exceeded."""
+        for row in rows:
+            self.build_rows += 1
+            key = row_key(row, self.build_keys)
+            if key is None and not self._keep_unmatched_build:
+                continue
+            if self.spilled:
+                self._write(self._build_files, key, row)
+                continue
+            self.table.setdefault(key, []).append(row)
+            self.memory_bytes += row_size(row)
+            if self.memory_bytes > self.memory_limit:
+                self._spill()
+
+    def probe(self, rows: Iterable[Row]) -> Iterator[Row]:
+        """Stream probe-side rows through the hash table, yielding joined rows."""
+        for row in rows:
+            self.probe_rows += 1
+            key = row_key(row, self.probe_keys)
+            if not self.spilled:
+                yield from self._match(self.table, key, row)
+            elif key is not None or self._keep_unmatched_probe:
+                # Joined partition by partition in finish()
+                self._write(self._probe_files, key, row)
+
+    def finish(self) -> Iterator[Row]:
+        """Yield the remaining rows: spilled partitions and unmatched left rows."""
+        if not self.spilled:
+            yield from self._unmatched(self.table)
+            return
+
+        for build_file, probe_file in zip(self._build_files, self._probe_files):
+            table: Dict[Optional[Key], List[Row]] = {}
+            for key, row in self._read(build_file):
+                table.setdefault(key, []).append(row)
+            self.matched = set()
+            for key, row in self._read(probe_file):
+                yield from self._match(table, key, row)
+            yield from self._unmatched(table)
+
+    def key_batches(self, size: int) -> Iterator[List[Key]]:
+        """
+        Yield the distinct non-NULL build keys in lists of at most `size`.
+
+        Once spilled, keys are collected one build partition at a time (a key
+        always hashes to the same partition), so memory stays bounded by one
+        partition's keys rather than all of them.
+        """
+        if not self.spilled:
+            keys = (key for key in self.table if key is not None)
+            while batch := list(islice(keys, size)):
+                yield batch
+            return
+
+        for build_file in self._build_files:
+            keys = iter({key for key, _ in self._read(build_file) if key is not None})
+            while batch := list(islice(keys, size)):
+                yield batch
+
+    def close(self) -> None:
+        """Remove spill files (safe to call more than once)."""
+        if self._tmpdir is not None:
+            for f in self._build_files + self._probe_files:
+                f.close()
+            self._tmpdir.cleanup()
+
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "build_side": self.build_side,
+            "build_rows": self.build_rows,
+            "probe_rows": self.probe_rows,
+            "spilled": self.spilled,
+            "spill_partitions": self.partitions if self.spilled else 0,
+        }
+
+    def _match(self, table: Dict, key: Optional[Key], probe_row: Row) -> Iterator[Row]:
+        matches = table.get(key) if key is not None else None
+        if matches:
+            if self._keep_unmatched_build:
+                self.matched.add(key)
+            for build_row in matches:
+                yield self._emit(build_row, probe_row)
+        elif self._keep_unmatched_probe:
+            yield self._emit(None, probe_row)
+
+    def _unmatched(self, table: Dict) -> Iterator[Row]:
+        if not self._keep_unmatched_build:
+            return
+        for key, rows in table.items():
+            if key is None or key not in self.matched:
+                for row in rows:
+                    yield self._emit(row, None)
+
+    def _spill(self) -> None:
+        self._tmpdir = tempfile.TemporaryDirectory(prefix="federated-join-", dir=self.spill_dir)
+        self._build_files = self._open_partitions("build")
+        self._probe_files = self._open_partitions("probe")
+        for key, rows in self.table.items():
+            for row in rows:
+                self._write(self._build_files, key, row)
+        self.table = {}
+        self.memory_bytes = 0
+
+    def _open_partitions(self, name: str) -> List:
+        return [
+            open(os.path.join(self._tmpdir.name, f"{name}-{i}.pkl"), "w+b")
+            for i in range(self.partitions)
+        ]
+
+    def _write(self, files: List, key: Optional[Key], row: Row) -> None:
+        pickle.dump((key, row), files[hash(key) % self.partitions], pickle.HIGHEST_PROTOCOL)
+
+    @staticmethod
+    def _read(f) -> Iterator[Tuple[Optional[Key], Row]]:
+        f.seek(0)
+        while True:
+            try:
+                yield pickle.load(f)
+            except EOFError:
+                return
@@ -0,0 +1,71 @@
+"""
+Rank fusion for hybrid (vector + full-text) search.
+
+Each retriever returns a ranked list of (id, score) pairs, best first. The
+lists are fused into one ranking either with reciprocal rank fusion, which
+only looks at ranks and so needs no score calibration between retrievers, or
+with a weighted sum of min-max normalized scores.
+"""
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+FUSION_METHODS = ("rrf", "weighted")
+
+# Standard RRF constant: dampens the advantage of the very top ranks
+RRF_K = 60
+
+Ranked = Sequence[Tuple[Any, float]]
+
+
+def reciprocal_rank_fusion(
+    ranked_lists: Dict[str, Ranked], weights: Dict[str, float], k: int = RRF_K
+) -> Dict[Any, float]:
+    """Score each id as the sum over retrievers of weight / (k + rank)."""
+    scores: Dict[Any, float] = {}
+    for name, ranked in ranked_lists.items():
+        for rank, (item_id, _) in enumerate(ranked, start=1):
+            scores[item_id] = scores.get(item_id, 0.0) + weights[name] / (k + rank)
+    return scores
+
+
+def weighted_fusion(ranked_lists: Dict[str, Ranked], weights: Dict[str, float]) -> Dict[Any, float]:
+    """Score each id as the weighted sum of its min-max normalized retriever scores."""
+    scores: Dict[Any, float] = {}
+    for name, ranked in ranked_lists.items():
+        if not ranked:
+            continue
+        values = [score for _, score in ranked]
+        low, high = min(values), max(values)
+        for item_id, score in ranked:
+            normalized = (score - low) / (high - low) if high > low else 1.0
+            scores[item_id] = scores.get(item_id, 0.0) + weights[name] * normalized
+    return scores
+
+
+def fuse(
+    ranked_lists: Dict[str, Ranked], weights: Dict[str, float], method: str = "rrf"
+) -> List[Dict[str, Any]]:
+    """
+    Fuse ranked lists into one ranking, best first.
+
+    Returns:
+        list: {"id", "score", "ranks"} per id, where ranks maps each retriever
+              that returned the id to its 1-based rank there
+    """
+    if method not in FUSION_METHODS:
+        raise ValueError(f"fusion must be one of: {', '.join(FUSION_METHODS)}")
+    if method == "rrf":
+        scores = reciprocal_rank_fusion(ranked_lists, weights)
+    else:
+        scores = weighted_fusion(ranked_lists, weights)
+
+    ranks: Dict[Any, Dict[str, int]] = {}
+    for name, ranked in ranked_lists.items():
+        for rank, (item_id, _) in enumerate(ranked, start=1):
+            ranks.setdefault(item_id, {})[name] = rank
+
+    fused = sorted(scores.items(), key=lambda item: item[1], reverse=True)
+    return [
+        {"id": item_id, "score": round(score, 6), "ranks": ranks[item_id]}
+        for item_id, score in fused
+    ]
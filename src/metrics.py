@@ -0,0 +1,205 @@
+"""
+Prometheus instrumentation for bigtorig-mcp-hub.
+
+Every tool is wrapped with `instrument`, which records call/error counts, total
+latency, rows returned and response size. Inside a tool, `phase()` blocks split
+the latency into connection acquisition, backend execution, fetch and
+serialization so a slow call can be attributed to the right layer.
+
+FastMCP serializes each result itself, so `instrument` only serializes a
+sample of results (every METRICS_SERIALIZE_SAMPLE_EVERY-th call per tool,
+default 16) to time the serialize phase and measure response bytes.
+
+Metrics are exposed in Prometheus text format at /metrics (see server.py).
+When the hub runs several worker processes, PROMETHEUS_MULTIPROC_DIR is set
+before the workers start and /metrics aggregates the samples of all of them.
+"""
+
+import functools
+import itertools
+import json
+import os
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Callable, Optional
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST,
+    CollectorRegistry,
+    Counter,
+    Gauge,
+    Histogram,
+    generate_latest,
+    multiprocess,
+)
+
+# Latency buckets (seconds) - from sub-millisecond cache hits to slow agent queries
+LATENCY_BUCKETS = (
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+)
+
+# Response size buckets (bytes) - 256B up to 16MB
+SIZE_BUCKETS = tuple(256 * 4**i for i in range(9))
+
+TOOL_CALLS = Counter("mcp_tool_calls_total", "Total tool invocations", ["tool"])
+TOOL_ERRORS = Counter("mcp_tool_errors_total", "Tool invocations that returned an error", ["tool"])
+TOOL_LATENCY = Histogram(
+    "mcp_tool_latency_seconds",
+    "Tool latency up to returning the result (serialization is the sampled serialize phase)",
+    ["tool"],
+    buckets=LATENCY_BUCKETS,
+)
+TOOL_PHASE_LATENCY = Histogram(
+    "mcp_tool_phase_latency_seconds",
+    "Tool latency split by phase (connect, execute, fetch, serialize)",
+    ["tool", "phase"],
+    buckets=LATENCY_BUCKETS,
+)
+TOOL_ROWS = Counter("mcp_tool_rows_returned_total", "Rows/records returned by tools", ["tool"])
+TOOL_RESPONSE_BYTES = Histogram(
+    "mcp_tool_response_bytes",
+    "Size of the JSON-serialized tool response",
+    ["tool"],
+    buckets=SIZE_BUCKETS,
+)
+BACKEND_POOL_CONNECTIONS = Gauge(
+    "mcp_backend_pool_connections",
+    "Pooled connections per backend by state (in_use, idle)",
+    ["backend", "state"],
+    multiprocess_mode="livesum",
+)
+BACKEND_CONNECTS = Counter(
+    "mcp_backend_connects_total", "Connections/clients created per backend", ["backend"]
+)
+CACHE_REQUESTS = Counter(
+    "mcp_cache_requests_total", "Shared cache lookups by result (hit, miss)", ["tool", "result"]
+)
+
+METRICS_CONTENT_TYPE = CONTENT_TYPE_LATEST
+
+# Keys tools use to report how many items they returned
+_COUNT_KEYS = (
+    "row_count",
+    "record_count",
+    "node_count",
+    "relationship_count",
+    "table_count",
+    "database_count",
+    "collection_count",
+    "point_count",
+)
+
+# Serialize one in this many results per tool (1 = every call)
+SERIALIZE_SAMPLE_EVERY = max(1, int(os.getenv("METRICS_SERIALIZE_SAMPLE_EVERY", "16")))
+
+# Name of the tool currently executing (None outside instrumented tools)
+_current_tool: ContextVar[Optional[str]] = ContextVar("mcp_current_tool", default=None)
+
+
+@contextmanager
+def phase(name: str):
+    """Time a block as one phase of the currently executing tool."""
+    tool = _current_tool.get()
+    if tool is None:
+        yield
+        return
+
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        TOOL_PHASE_LATENCY.labels(tool, name).observe(time.perf_counter() - start)
+
+
+def _is_error(result: Any) -> bool:
+    return isinstance(result, dict) and (result.get("success") is False or "error" in result)
+
+
+def _row_count(result: Any) -> int:
+    if isinstance(result, dict):
+        for key in _COUNT_KEYS:
+            if isinstance(result.get(key), int):
+                return result[key]
+    return 0
+
+
+def instrument(fn: Callable[..., Any]) -> Callable[..., Any]:
+    """
+    Record call count, errors, latency, rows and response bytes for a tool.
+
+    Serialization cost and response size are measured on a sample of calls
+    (the first, then every SERIALIZE_SAMPLE_EVERY-th), since the extra
+    json.dumps would otherwise double the CPU spent on large results.
+    """
+    tool = fn.__name__
+    calls = itertools.count()
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        TOOL_CALLS.labels(tool).inc()
+        token = _current_tool.set(tool)
+        start = time.perf_counter()
+        try:
+            result = fn(*args, **kwargs)
+        except Exception:
+            TOOL_ERRORS.labels(tool).inc()
+            TOOL_LATENCY.labels(tool).observe(time.perf_counter() - start)
+            raise
+        finally:
+            _current_tool.reset(token)
+
+        end = time.perf_counter()
+        if next(calls) % SERIALIZE_SAMPLE_EVERY == 0:
+            payload = json.dumps(result, default=str)
+            serialize_time = time.perf_counter() - end
+            TOOL_PHASE_LATENCY.labels(tool, "serialize").observe(serialize_time)
+            TOOL_RESPONSE_BYTES.labels(tool).observe(len(payload))
+
+        TOOL_LATENCY.labels(tool).observe(end - start)
+        TOOL_ROWS.labels(tool).inc(_row_count(result))
+        if _is_error(result):
+            TOOL_ERRORS.labels(tool).inc()
+        return result
+
+    return wrapper
+
+
+def connection_opened(backend: str, count: int = 1) -> None:
+    """Record new connections/clients for a backend."""
+    BACKEND_CONNECTS.labels(backend).inc(count)
+
+
+def pool_state(backend: str, in_use: int, idle: int) -> None:
+    """Update the pool gauges for a backend."""
+    BACKEND_POOL_CONNECTIONS.labels(backend, "in_use").set(in_use)
+    BACKEND_POOL_CONNECTIONS.labels(backend, "idle").set(idle)
+
+
+def cache_lookup(tool: str, hit: bool) -> None:
+    """Record a shared cache hit or miss for a tool."""
+    CACHE_REQUESTS.labels(tool, "hit" if hit else "miss").inc()
+
+
+def render_metrics() -> bytes:
+    """Render all metrics in Prometheus text exposition format."""
+    if os.getenv("PROMETHEUS_MULTIPROC_DIR"):
+        # Aggregate the per-process sample files written by every worker
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+        return generate_latest(registry)
+    return generate_latest()
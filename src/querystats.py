@@ -0,0 +1,307 @@
+"""
+Slow-query log and query fingerprint statistics for bigtorig-mcp-hub.
+
+Every postgres_query, mysql_query and neo4j_query execution is recorded in a
+bounded in-process ring buffer. Queries are normalized into fingerprints
+(literals stripped, whitespace collapsed) so agent-written variations of the
+same statement aggregate together, and per-fingerprint totals are kept for the
+query_stats tool.
+
+Configuration (environment variables):
+- QUERY_LOG_SIZE: ring buffer capacity (default: 1000)
+- QUERY_SLOW_MS: threshold for the slow-query log in milliseconds (default: 500)
+- QUERY_STATS_DUMP_PATH: optional file to periodically dump stats to as JSON
+- QUERY_STATS_DUMP_INTERVAL: seconds between dumps (default: 60)
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Dict, List, Optional, Tuple
+
+# Cap on distinct fingerprints tracked; the cheapest one is evicted when full
+MAX_FINGERPRINTS = 500
+
+# Durations kept per fingerprint for percentile estimates
+DURATION_SAMPLES = 256
+
+# Raw query text kept per record
+MAX_QUERY_CHARS = 2000
+
+ORDER_BY_FIELDS = ("total_time", "p95", "calls", "mean", "errors")
+
+# Comments, quoted text and numbers are matched in one left-to-right scan, so a
+# quote inside a comment (or comment markers inside quotes) can't be misread
+_TOKEN_PATTERNS = {
+    "comment": r"--[^\n]*|/\*.*?\*/",
+    "single": r"'(?:[^'\\]|\\.|'')*'",
+    "double": r"\"(?:[^\"\\]|\\.|\"\")*\"",
+    "number": r"(?<![\w$])-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?\b",
+}
+
+
+def _token_re(line_comment: str = "") -> re.Pattern:
+    patterns = dict(_TOKEN_PATTERNS)
+    if line_comment:
+        patterns["comment"] += f"|{line_comment}[^\\n]*"
+    return re.compile("|".join(f"(?P<{name}>{p})" for name, p in patterns.items()), re.DOTALL)
+
+
+_SQL_TOKEN_RE = _token_re()
+# Cypher also has // line comments; in SQL // can appear inside identifiers
+_CYPHER_TOKEN_RE = _token_re("//")
+_LIST_RE = re.compile(r"([(\[])\s*\?(?:\s*,\s*\?)*\s*([)\]])")
+_WHITESPACE_RE = re.compile(r"\s+")
+
+# Backends where "..." is a string literal; in Postgres it quotes an identifier
+DOUBLE_QUOTED_STRING_BACKENDS = ("mysql", "neo4j")
+
+
+def fingerprint(query: str, backend: Optional[str] = None) -> str:
+    """
+    Normalize a SQL/Cypher query so that variations differing only in literals match.
+
+    Single-quoted text is always a literal. Double-quoted text is stripped only
+    for backends in DOUBLE_QUOTED_STRING_BACKENDS and kept as an identifier
+    otherwise. `//` starts a comment only in Cypher (backend "neo4j").
+
+    Example:
+        SELECT * FROM users WHERE id IN (1, 2, 3) AND name = 'bob' LIMIT 100
+        -> select * from users where id in (?+) and name = ? limit ?
+    """
+    strip_double = backend in DOUBLE_QUOTED_STRING_BACKENDS
+
+    def replace(match: re.Match) -> str:
+        if match.lastgroup == "comment":
+            return " "
+        if match.lastgroup == "double" and not strip_double:
+            return match.group(0)
+        return "?"
+
+    token_re = _CYPHER_TOKEN_RE if backend == "neo4j" else _SQL_TOKEN_RE
+    normalized = token_re.sub(replace, query)
+    normalized = _LIST_RE.sub(r"\1?+\2", normalized)
+    normalized = _WHITESPACE_RE.sub(" ", normalized).strip().rstrip(";").strip()
+    return normalized.lower()
+
+
+def _percentile(values: List[float], pct: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+class _FingerprintStats:
+    """Running totals for one (backend, fingerprint) pair."""
+
+    __slots__ = ("calls", "errors", "total_time", "max_time", "rows", "durations", "last_seen")
+
+    def __init__(self):
+        self.calls = 0
+        self.errors = 0
+        self.total_time = 0.0
+        self.max_time = 0.0
+        self.rows = 0
+        self.durations = deque(maxlen=DURATION_SAMPLES)
+        self.last_seen = 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        durations = list(self.durations)
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "total_ms": round(self.total_time * 1000, 3),
+            "mean_ms": round(self.total_time / self.calls * 1000, 3) if self.calls else 0.0,
+            "p50_ms": round(_percentile(durations, 50) * 1000, 3),
+            "p95_ms": round(_percentile(durations, 95) * 1000, 3),
+            "max_ms": round(self.max_time * 1000, 3),
+            "rows": self.rows,
+            "last_seen": self.last_seen,
+        }
+
+
+class QueryLog:
+    """Thread-safe bounded query log with per-fingerprint aggregates."""
+
+    def __init__(self, size: int = 1000, slow_ms: float = 500.0):
+        self.slow_ms = slow_ms
+        self._lock = threading.Lock()
+        self._records: deque = deque(maxlen=size)
+        self._slow: deque = deque(maxlen=size)
+        self._stats: Dict[Tuple[str, str], _FingerprintStats] = {}
+        self._started = time.time()
+
+    def record(
+        self,
+        backend: str,
+        query: str,
+        duration: float,
+        rows: int = 0,
+        error: Optional[str] = None,
+    ) -> None:
+        """Record one query execution (duration in seconds)."""
+        fp = fingerprint(query, backend)
+        now = time.time()
+        entry = {
+            "timestamp": now,
+            "backend": backend,
+            "fingerprint": fp,
+            "query": query[:MAX_QUERY_CHARS],
+            "duration_ms": round(duration * 1000, 3),
+            "rows": rows,
+            "error": error,
+        }
+
+        with self._lock:
+            self._records.append(entry)
+            if entry["duration_ms"] >= self.slow_ms:
+                self._slow.append(entry)
+
+            key = (backend, fp)
+            stats = self._stats.get(key)
+            if stats is None:
+                if len(self._stats) >= MAX_FINGERPRINTS:
+                    cheapest = min(self._stats, key=lambda k: self._stats[k].total_time)
+                    del self._stats[cheapest]
+                stats = self._stats[key] = _FingerprintStats()
+
+            stats.calls += 1
+            stats.total_time += duration
+            stats.max_time = max(stats.max_time, duration)
+            stats.rows += rows
+            stats.durations.append(duration)
+            stats.last_seen = now
+            if error:
+                stats.errors += 1
+
+    def top(
+        self, n: int = 10, order_by: str = "total_time", backend: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Return the top-N fingerprints ordered by total_time, p95, calls, mean or errors."""
+        if order_by not in ORDER_BY_FIELDS:
+            raise ValueError(f"order_by must be one of {', '.join(ORDER_BY_FIELDS)}")
+
+        with self._lock:
+            rows = [
+                {"backend": b, "fingerprint": fp, **stats.to_dict()}
+                for (b, fp), stats in self._stats.items()
+                if backend is None or b == backend
+            ]
+
+        sort_key = {
+            "total_time": "total_ms",
+            "p95": "p95_ms",
+            "calls": "calls",
+            "mean": "mean_ms",
+            "errors": "errors",
+        }[order_by]
+        rows.sort(key=lambda r: r[sort_key], reverse=True)
+        return rows[:n]
+
+    def slow_queries(self, n: int = 10, backend: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Return the most recent slow queries (newest first)."""
+        with self._lock:
+            entries = [
+                e for e in reversed(self._slow) if backend is None or e["backend"] == backend
+            ]
+        return entries[:n]
+
+    def summary(self) -> Dict[str, Any]:
+        """Return ring buffer and aggregate sizes."""
+        with self._lock:
+            return {
+                "recorded": len(self._records),
+                "capacity": self._records.maxlen,
+                "fingerprints": len(self._stats),
+                "slow_threshold_ms": self.slow_ms,
+                "since": self._started,
+            }
+
+    def dump(self, path: str, n: int = 50) -> None:
+        """Write a JSON snapshot of the stats to path (atomically)."""
+        snapshot = {
+            "generated_at": time.time(),
+            "pid": os.getpid(),
+            "summary": self.summary(),
+            "top_by_total_time": self.top(n, "total_time"),
+            "slow_queries": self.slow_queries(n),
+        }
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "w") as f:
+            json.dump(snapshot, f, indent=2, default=str)
+        os.replace(tmp_path, path)
+
+
+QUERY_LOG = QueryLog(
+    size=int(os.getenv("QUERY_LOG_SIZE", "1000")),
+    slow_ms=float(os.getenv("QUERY_SLOW_MS", "500")),
+)
+
+
+class _Execution:
+    """Mutable handle yielded by track() so callers can report the row count."""
+
+    __slots__ = ("rows",)
+
+    def __init__(self):
+        self.rows = 0
+
+
+@contextmanager
+def track(backend: str, query: str):
+    """
+    Record the enclosed query execution in the global query log.
+
+    Usage:
+        with track("postgres", sql) as execution:
+            cur.execute(sql)
+            rows = cur.fetchall()
+            execution.rows = len(rows)
+    """
+    execution = _Execution()
+    error = None
+    start = time.perf_counter()
+    try:
+        yield execution
+    except Exception as e:
+        error = str(e)
+        raise
+    finally:
+        # Also reached when a generator consuming the rows is closed early
+        # (GeneratorExit), e.g. federated_join stopping at its row limit
+        duration = time.perf_counter() - start
+        QUERY_LOG.record(backend, query, duration, rows=execution.rows, error=error)
+
+
+def start_dump_thread(per_process: bool = False) -> Optional[threading.Thread]:
+    """
+    Start periodic dumps to QUERY_STATS_DUMP_PATH if configured.
+
+    With per_process=True (several worker processes) each process dumps to
+    `<path>.<pid>` before the extension so workers don't overwrite each other.
+    """
+    path = os.getenv("QUERY_STATS_DUMP_PATH")
+    if not path:
+        return None
+    if per_process:
+        root, ext = os.path.splitext(path)
+        path = f"{root}.{os.getpid()}{ext}"
+    interval = float(os.getenv("QUERY_STATS_DUMP_INTERVAL", "60"))
+
+    def _loop():
+        while True:
+            time.sleep(interval)
+            try:
+                QUERY_LOG.dump(path)
+            except OSError as e:
+                print(f"⚠️  Failed to dump query stats to {path}: {e}")
+
+    thread = threading.Thread(target=_loop, name="query-stats-dump", daemon=True)
+    thread.start()
+    return thread
@@ -8,76 +8,431 @@ MCP server providing access to Hostinger infrastructure services:
 - Neo4j (Graph Database)
 """
 
-import os
-from typing import Optional, List, Dict, Any
-from fastmcp import FastMCP
-import psycopg2
-from psycopg2.extras import RealDictCursor
-from qdrant_client import QdrantClient
-from neo4j import GraphDatabase
-import mysql.connector
-from mysql.connector import Error as MySQLError
+import time
+
+# Taken before the remaining imports so the banner can report core import time
+_MODULE_LOAD_START = time.perf_counter()
+
+import atexit  # noqa: E402
+import gzip  # noqa: E402
+import importlib  # noqa: E402
+import json  # noqa: E402
+import os  # noqa: E402
+import re  # noqa: E402
+import shutil  # noqa: E402
+import sqlite3  # noqa: E402
+import sys  # noqa: E402
+import tempfile  # noqa: E402
+import threading  # noqa: E402
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError  # noqa: E402
+from contextlib import contextmanager  # noqa: E402
+from itertools import chain, islice  # noqa: E402
+from typing import Optional, List, Dict, Any, Callable, Iterable  # noqa: E402
+import uvicorn  # noqa: E402
+from fastmcp import FastMCP  # noqa: E402
+from starlette.middleware import Middleware  # noqa: E402
+from starlette.requests import Request  # noqa: E402
+from starlette.responses import JSONResponse, Response  # noqa: E402
+
+from cache import RESULT_CACHE_TTL, SCHEMA_CACHE_TTL, SHARED_CACHE, cached  # noqa: E402
+from compression import CompressionMiddleware, supported_encodings  # noqa: E402
+from federation import JOIN_TYPES, HashJoin, pick_build_side  # noqa: E402
+from fusion import FUSION_METHODS, fuse  # noqa: E402
+from metrics import (  # noqa: E402
+    METRICS_CONTENT_TYPE,
+    connection_opened,
+    instrument,
+    phase,
+    pool_state,
+    render_metrics,
+)
+from querystats import ORDER_BY_FIELDS, QUERY_LOG, start_dump_thread, track  # noqa: E402
 
 # Initialize FastMCP server
 mcp = FastMCP("bigtorig-mcp-hub")
 
+# Backends are enabled through configuration; client libraries for disabled
+# backends are never imported and their tools are never registered.
+ALL_BACKENDS = ("postgres", "mysql", "qdrant", "neo4j")
+ENABLED_BACKENDS = [
+    b.strip().lower()
+    for b in os.getenv("ENABLED_BACKENDS", ",".join(ALL_BACKENDS)).split(",")
+    if b.strip()
+]
+_unknown_backends = set(ENABLED_BACKENDS) - set(ALL_BACKENDS)
+if _unknown_backends:
+    raise ValueError(
+        f"Unknown backend(s) in ENABLED_BACKENDS: {', '.join(sorted(_unknown_backends))} "
+        f"(expected a comma-separated subset of {', '.join(ALL_BACKENDS)})"
+    )
+
+# Tools registered per enabled backend (filled in by @backend_tool)
+BACKEND_TOOLS: Dict[str, List[str]] = {backend: [] for backend in ENABLED_BACKENDS}
+
+# Tools spanning several backends (filled in by @cross_backend_tool)
+CROSS_BACKEND_TOOLS: List[str] = []
+
+# Callables of registered backend tools by name, for tools that dispatch to other tools
+TOOL_FUNCTIONS: Dict[str, Callable[..., dict]] = {}
+
+# Import time (seconds) of each backend client library, recorded on first use
+IMPORT_TIMES: Dict[str, float] = {}
+
+
+def backend_tool(backend: str):
+    """Register a tool with the MCP server only if its backend is enabled."""
+
+    def decorator(fn):
+        if backend not in ENABLED_BACKENDS:
+            return fn
+        BACKEND_TOOLS[backend].append(fn.__name__)
+        TOOL_FUNCTIONS[fn.__name__] = fn
+        return mcp.tool()(fn)
+
+    return decorator
+
+
+def cross_backend_tool(*backends: str):
+    """Register a tool only if all of the backends it needs are enabled."""
+
+    def decorator(fn):
+        if not all(backend in ENABLED_BACKENDS for backend in backends):
+            return fn
+        CROSS_BACKEND_TOOLS.append(fn.__name__)
+        return mcp.tool()(fn)
+
+    return decorator
+
+
+def import_backend(module_name: str):
+    """Import a backend client library on first use and record how long it took."""
+    module = sys.modules.get(module_name)
+    if module is None:
+        start = time.perf_counter()
+        module = importlib.import_module(module_name)
+        IMPORT_TIMES[module_name] = time.perf_counter() - start
+        print(f"📦 Imported {module_name} in {IMPORT_TIMES[module_name] * 1000:.1f} ms")
+    return module
+
+
+def real_dict_cursor():
+    """psycopg2 RealDictCursor class (imports psycopg2 on first use)."""
+    return import_backend("psycopg2.extras").RealDictCursor
+
+
+def mysql_error():
+    """mysql.connector base Error class (imports mysql.connector on first use)."""
+    return import_backend("mysql.connector").Error
+
+
+# Connection pool sizes. Postgres opens POSTGRES_POOL_MIN connections up front and
+# grows to POSTGRES_POOL_MAX; the MySQL pool is fixed at MYSQL_POOL_SIZE connections.
+POSTGRES_POOL_MIN = int(os.getenv("POSTGRES_POOL_MIN", "1"))
+POSTGRES_POOL_MAX = int(os.getenv("POSTGRES_POOL_MAX", "10"))
+MYSQL_POOL_SIZE = int(os.getenv("MYSQL_POOL_SIZE", "5"))
+NEO4J_POOL_MIN = int(os.getenv("NEO4J_POOL_MIN", "1"))
+NEO4J_POOL_MAX = int(os.getenv("NEO4J_POOL_MAX", "100"))
+
+# Seconds a tool waits for a free pooled connection before failing
+POOL_TIMEOUT = float(os.getenv("POOL_TIMEOUT", "30"))
+
 # Database connection globals (lazy initialization)
-_postgres_conn = None
+_postgres_pool = None
 _qdrant_client = None
 _neo4j_driver = None
-_mysql_conn = None
-
-
-def get_postgres_connection():
-    """Get or create Postgres connection."""
-    global _postgres_conn
-    if _postgres_conn is None or _postgres_conn.closed:
-        _postgres_conn = psycopg2.connect(
-            host=os.getenv("POSTGRES_HOST", "172.23.0.1"),
-            port=int(os.getenv("POSTGRES_PORT", "5432")),
-            user=os.getenv("POSTGRES_USER", "postgres"),
-            password=os.getenv("POSTGRES_PASSWORD"),
-            database=os.getenv("POSTGRES_DB", "postgres"),
+_mysql_pool = None
+_mysql_in_use = 0
+
+# One lock per backend so a slow backend never blocks the others
+_backend_locks = {backend: threading.Lock() for backend in ALL_BACKENDS}
+
+# psycopg2 and mysql.connector pools raise as soon as they are exhausted; callers
+# take a slot first so they queue for a connection instead
+_pool_slots = {
+    "postgres": (threading.BoundedSemaphore(POSTGRES_POOL_MAX), POSTGRES_POOL_MAX),
+    "mysql": (threading.BoundedSemaphore(MYSQL_POOL_SIZE), MYSQL_POOL_SIZE),
+}
+
+
+def _acquire_pool_slot(backend: str) -> threading.BoundedSemaphore:
+    """Wait up to POOL_TIMEOUT seconds for a free connection slot in a backend's pool."""
+    slots, size = _pool_slots[backend]
+    if not slots.acquire(timeout=POOL_TIMEOUT):
+        raise TimeoutError(
+            f"Timed out after {POOL_TIMEOUT:g}s waiting for a {backend} connection "
+            f"(pool size {size})"
         )
-    return _postgres_conn
+    return slots
+
+
+def get_postgres_pool():
+    """Get or create the Postgres connection pool."""
+    global _postgres_pool
+    with _backend_locks["postgres"]:
+        if _postgres_pool is None:
+            pool = import_backend("psycopg2.pool")
+            _postgres_pool = pool.ThreadedConnectionPool(
+                POSTGRES_POOL_MIN,
+                POSTGRES_POOL_MAX,
+                host=os.getenv("POSTGRES_HOST", "172.23.0.1"),
+                port=int(os.getenv("POSTGRES_PORT", "5432")),
+                user=os.getenv("POSTGRES_USER", "postgres"),
+                password=os.getenv("POSTGRES_PASSWORD"),
+                database=os.getenv("POSTGRES_DB", "postgres"),
+            )
+            connection_opened("postgres", POSTGRES_POOL_MIN)
+    return _postgres_pool
+
+
+def _update_postgres_pool_state(pool) -> None:
+    # psycopg2 pools keep checked-out connections in _used and idle ones in _pool
+    pool_state("postgres", in_use=len(pool._used), idle=len(pool._pool))
+
+
+@contextmanager
+def postgres_connection():
+    """
+    Check a connection out of the Postgres pool and return it afterwards.
+
+    Waits up to POOL_TIMEOUT seconds when all POSTGRES_POOL_MAX connections are in use.
+    """
+    pool = get_postgres_pool()
+    with phase("connect"):
+        slots = _acquire_pool_slot("postgres")
+        try:
+            conn = pool.getconn()
+        except Exception:
+            slots.release()
+            raise
+    _update_postgres_pool_state(pool)
+    try:
+        yield conn
+    finally:
+        try:
+            if not conn.closed and conn.autocommit:
+                conn.autocommit = False
+            # putconn rolls back open transactions; broken connections are discarded
+            pool.putconn(conn, close=bool(conn.closed))
+            _update_postgres_pool_state(pool)
+        finally:
+            slots.release()
 
 
 def get_qdrant_client():
     """Get or create Qdrant client."""
     global _qdrant_client
-    if _qdrant_client is None:
-        api_key = os.getenv("QDRANT_API_KEY")
-        _qdrant_client = QdrantClient(
-            host=os.getenv("QDRANT_HOST", "172.23.0.1"),
-            port=int(os.getenv("QDRANT_PORT", "6333")),
-            api_key=api_key if api_key else None,
-        )
+    with _backend_locks["qdrant"]:
+        if _qdrant_client is None:
+            api_key = os.getenv("QDRANT_API_KEY")
+            QdrantClient = import_backend("qdrant_client").QdrantClient
+            _qdrant_client = QdrantClient(
+                host=os.getenv("QDRANT_HOST", "172.23.0.1"),
+                port=int(os.getenv("QDRANT_PORT", "6333")),
+                api_key=api_key if api_key else None,
+            )
+            connection_opened("qdrant")
     return _qdrant_client
 
 
 def get_neo4j_driver():
     """Get or create Neo4j driver."""
     global _neo4j_driver
-    if _neo4j_driver is None:
-        _neo4j_driver = GraphDatabase.driver(
-            os.getenv("NEO4J_URI", "bolt://172.23.0.1:7687"),
-            auth=(os.getenv("NEO4J_USER", "neo4j"), os.getenv("NEO4J_PASSWORD")),
-        )
+    with _backend_locks["neo4j"]:
+        if _neo4j_driver is None:
+            GraphDatabase = import_backend("neo4j").GraphDatabase
+            _neo4j_driver = GraphDatabase.driver(
+                os.getenv("NEO4J_URI", "bolt://172.23.0.1:7687"),
+                auth=(os.getenv("NEO4J_USER", "neo4j"), os.getenv("NEO4J_PASSWORD")),
+                max_connection_pool_size=NEO4J_POOL_MAX,
+            )
+            connection_opened("neo4j")
     return _neo4j_driver
 
 
-def get_mysql_connection():
-    """Get or create MySQL connection."""
-    global _mysql_conn
-    if _mysql_conn is None or not _mysql_conn.is_connected():
-        _mysql_conn = mysql.connector.connect(
-            host=os.getenv("MYSQL_HOST", "172.23.0.1"),
-            port=int(os.getenv("MYSQL_PORT", "3306")),
-            user=os.getenv("MYSQL_USER", "maui_user"),
-            password=os.getenv("MYSQL_PASSWORD"),
-            database=os.getenv("MYSQL_DATABASE", "maui_app_db"),
-        )
-    return _mysql_conn
+def get_mysql_pool():
+    """Get or create the MySQL connection pool (opens MYSQL_POOL_SIZE connections)."""
+    global _mysql_pool
+    with _backend_locks["mysql"]:
+        if _mysql_pool is None:
+            pooling = import_backend("mysql.connector.pooling")
+            _mysql_pool = pooling.MySQLConnectionPool(
+                pool_name="mcp_hub",
+                pool_size=MYSQL_POOL_SIZE,
+                host=os.getenv("MYSQL_HOST", "172.23.0.1"),
+                port=int(os.getenv("MYSQL_PORT", "3306")),
+                user=os.getenv("MYSQL_USER", "maui_user"),
+                password=os.getenv("MYSQL_PASSWORD"),
+                database=os.getenv("MYSQL_DATABASE", "maui_app_db"),
+            )
+            connection_opened("mysql", MYSQL_POOL_SIZE)
+            pool_state("mysql", in_use=0, idle=MYSQL_POOL_SIZE)
+    return _mysql_pool
+
+
+def _update_mysql_in_use(delta: int) -> None:
+    global _mysql_in_use
+    with _backend_locks["mysql"]:
+        _mysql_in_use += delta
+        pool_state("mysql", in_use=_mysql_in_use, idle=MYSQL_POOL_SIZE - _mysql_in_use)
+
+
+@contextmanager
+def mysql_connection():
+    """
+    Check a connection out of the MySQL pool and return it afterwards.
+
+    Waits up to POOL_TIMEOUT seconds when all MYSQL_POOL_SIZE connections are in use.
+    """
+    pool = get_mysql_pool()
+    with phase("connect"):
+        slots = _acquire_pool_slot("mysql")
+        try:
+            # Reconnects transparently if the pooled connection was dropped
+            conn = pool.get_connection()
+        except Exception:
+            slots.release()
+            raise
+    _update_mysql_in_use(1)
+    try:
+        yield conn
+    finally:
+        try:
+            conn.close()  # returns the connection to the pool
+            _update_mysql_in_use(-1)
+        finally:
+            slots.release()
+
+
+@contextmanager
+def neo4j_transaction():
+    """
+    Open a Neo4j session and transaction, closing both afterwards.
+
+    Sessions pick a pooled connection lazily; beginning the transaction here
+    makes the driver acquire it inside the connect phase instead of on the
+    first run().
+    """
+    driver = get_neo4j_driver()
+    with phase("connect"):
+        session = driver.session()
+        try:
+            tx = session.begin_transaction()
+        except Exception:
+            session.close()
+            raise
+    try:
+        yield tx
+    finally:
+        # Tools only read, so the transaction is rolled back rather than committed
+        tx.close()
+        session.close()
+
+
+# =============================================================================
+# CONNECTION WARM-UP
+# =============================================================================
+
+# Set once startup warm-up has finished (or immediately when warm-up is disabled)
+_ready = threading.Event()
+WARMUP_RESULTS: Dict[str, dict] = {}
+
+
+def _warm_up_postgres():
+    # Creating the pool opens POSTGRES_POOL_MIN connections
+    with postgres_connection() as conn:
+        with conn.cursor() as cur:
+            cur.execute("SELECT 1")
+
+
+def _warm_up_mysql():
+    # Creating the pool opens MYSQL_POOL_SIZE connections
+    with mysql_connection() as conn:
+        cursor = conn.cursor()
+        cursor.execute("SELECT 1")
+        cursor.fetchall()
+        cursor.close()
+
+
+def _warm_up_qdrant():
+    # First request pays for the TCP/TLS handshake and API key check
+    get_qdrant_client().get_collections()
+
+
+def _warm_up_neo4j():
+    driver = get_neo4j_driver()
+    # Performs routing table discovery and authentication
+    driver.verify_connectivity()
+
+    def ping(_):
+        with driver.session() as session:
+            session.run("RETURN 1").consume()
+
+    if NEO4J_POOL_MIN <= 0:
+        return
+
+    # Concurrent sessions force the driver to open NEO4J_POOL_MIN connections
+    with ThreadPoolExecutor(max_workers=NEO4J_POOL_MIN) as executor:
+        list(executor.map(ping, range(NEO4J_POOL_MIN)))
+
+
+_WARMUP_TASKS = {
+    "postgres": _warm_up_postgres,
+    "mysql": _warm_up_mysql,
+    "qdrant": _warm_up_qdrant,
+    "neo4j": _warm_up_neo4j,
+}
+
+
+def warm_up_backends() -> Dict[str, dict]:
+    """
+    Open pooled connections to every enabled backend in parallel.
+
+    Each backend has its own timeout ({BACKEND}_WARMUP_TIMEOUT, default
+    WARMUP_TIMEOUT=10 seconds). A backend that times out keeps connecting in the
+    background but does not hold up the others or readiness.
+    """
+    default_timeout = float(os.getenv("WARMUP_TIMEOUT", "10"))
+
+    def timed(task):
+        start = time.perf_counter()
+        task()
+        return time.perf_counter() - start
+
+    executor = ThreadPoolExecutor(
+        max_workers=max(1, len(ENABLED_BACKENDS)), thread_name_prefix="warmup"
+    )
+    start = time.perf_counter()
+    futures = {b: executor.submit(timed, _WARMUP_TASKS[b]) for b in ENABLED_BACKENDS}
+
+    results = {}
+    for backend, future in futures.items():
+        timeout = float(os.getenv(f"{backend.upper()}_WARMUP_TIMEOUT", default_timeout))
+        remaining = max(0.0, start + timeout - time.perf_counter())
+        try:
+            elapsed = future.result(timeout=remaining)
+            results[backend] = {"status": "ok", "ms": round(elapsed * 1000, 1)}
+        except FutureTimeoutError:
+            results[backend] = {"status": "timeout", "timeout_s": timeout}
+        except Exception as e:
+            results[backend] = {"status": "error", "error": str(e)}
+
+    # Don't wait for backends that timed out
+    executor.shutdown(wait=False)
+    return results
+
+
+def start_warm_up() -> threading.Thread:
+    """Warm up backends in the background; readiness turns true when done."""
+
+    def run():
+        WARMUP_RESULTS.update(warm_up_backends())
+        for backend, result in WARMUP_RESULTS.items():
+            print(f"🔥 Warm-up {backend}: {result}")
+        _ready.set()
+
+    thread = threading.Thread(target=run, name="warmup", daemon=True)
+    thread.start()
+    return thread
 
 
 # =============================================================================
@@ -86,6 +441,7 @@ def get_mysql_connection():
 
 
 @mcp.tool()
+@instrument
 def health_check() -> dict:
     """
     Check if the MCP server is running and healthy.
@@ -103,6 +459,7 @@ def health_check() -> dict:
 
 
 @mcp.tool()
+@instrument
 def list_services() -> dict:
     """
     List all available infrastructure services and their tools.
@@ -110,43 +467,40 @@ def list_services() -> dict:
     Returns:
         dict: Information about available services and tools
     """
-    services = {
+    all_services = {
         "postgres": {
             "name": "Supabase Postgres",
             "endpoint": f"{os.getenv('POSTGRES_HOST')}:{os.getenv('POSTGRES_PORT')}",
             "status": "connected",
-            "tools": [
-                "postgres_list_databases",
-                "postgres_create_database",
-                "postgres_query",
-                "postgres_list_tables",
-                "postgres_describe_table",
-            ],
         },
         "mysql": {
             "name": "MySQL Database (maui_app_db)",
             "endpoint": f"{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}",
             "status": "connected",
-            "tools": ["mysql_query", "mysql_list_tables", "mysql_describe_table"],
         },
         "qdrant": {
             "name": "Qdrant Vector Database",
             "endpoint": f"{os.getenv('QDRANT_HOST')}:{os.getenv('QDRANT_PORT')}",
             "status": "connected",
-            "tools": ["qdrant_search", "qdrant_list_collections", "qdrant_collection_info"],
         },
         "neo4j": {
             "name": "Neo4j Graph Database",
             "endpoint": os.getenv("NEO4J_URI"),
             "status": "connected",
-            "tools": ["neo4j_query", "neo4j_list_nodes", "neo4j_get_relationships"],
         },
     }
 
+    # Only enabled backends have their tools registered
+    services = {
+        backend: {**all_services[backend], "tools": BACKEND_TOOLS[backend]}
+        for backend in ENABLED_BACKENDS
+    }
+
     return {
         "total_services": len(services),
         "total_tools": sum(len(s["tools"]) for s in services.values()),
         "services": services,
+        "cross_backend_tools": CROSS_BACKEND_TOOLS,
     }
 
 
@@ -155,7 +509,9 @@ def list_services() -> dict:
 # =============================================================================
 
 
-@mcp.tool()
+@backend_tool("postgres")
+@instrument
+@cached(RESULT_CACHE_TTL, "postgres")
 def postgres_query(sql: str, limit: int = 100) -> dict:
     """
     Execute a SQL query against the Supabase Postgres database.
@@ -181,26 +537,32 @@ def postgres_query(sql: str, limit: int = 100) -> dict:
     limit = min(limit, 1000)
 
     try:
-        conn = get_postgres_connection()
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            # Add LIMIT if not present
-            if "LIMIT" not in sql.upper():
-                sql = f"{sql.rstrip(';')} LIMIT {limit}"
+        with postgres_connection() as conn:
+            with conn.cursor(cursor_factory=real_dict_cursor()) as cur:
+                # Add LIMIT if not present
+                if "LIMIT" not in sql.upper():
+                    sql = f"{sql.rstrip(';')} LIMIT {limit}"
+
+                with track("postgres", sql) as execution:
+                    with phase("execute"):
+                        cur.execute(sql)
+                    with phase("fetch"):
+                        rows = cur.fetchall()
+                    execution.rows = len(rows)
 
-            cur.execute(sql)
-            rows = cur.fetchall()
-
-            return {
-                "success": True,
-                "row_count": len(rows),
-                "rows": [dict(row) for row in rows],
-                "query": sql,
-            }
+                return {
+                    "success": True,
+                    "row_count": len(rows),
+                    "rows": [dict(row) for row in rows],
+                    "query": sql,
+                }
     except Exception as e:
         return {"success": False, "error": str(e), "query": sql}
 
 
-@mcp.tool()
+@backend_tool("postgres")
+@instrument
+@cached(SCHEMA_CACHE_TTL, "postgres")
 def postgres_list_databases() -> dict:
     """
     List all databases on the Postgres server.
@@ -212,35 +574,38 @@ def postgres_list_databases() -> dict:
     psql -h {POSTGRES_HOST} -U {POSTGRES_USER} -c "\\l"
     """
     try:
-        conn = get_postgres_connection()
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            # Get all databases
-            cur.execute(
-                """
-                SELECT
-                    datname as database_name,
-                    pg_catalog.pg_get_userbyid(datdba) as owner,
-                    pg_encoding_to_char(encoding) as encoding,
-                    datcollate as collate,
-                    datctype as ctype
-                FROM pg_catalog.pg_database
-                ORDER BY datname
-            """
-            )
+        with postgres_connection() as conn:
+            with conn.cursor(cursor_factory=real_dict_cursor()) as cur:
+                # Get all databases
+                with phase("execute"):
+                    cur.execute(
+                        """
+                        SELECT
+                            datname as database_name,
+                            pg_catalog.pg_get_userbyid(datdba) as owner,
+                            pg_encoding_to_char(encoding) as encoding,
+                            datcollate as collate,
+                            datctype as ctype
+                        FROM pg_catalog.pg_database
+                        ORDER BY datname
+                    """
+                    )
 
-            databases = cur.fetchall()
+                with phase("fetch"):
+                    databases = cur.fetchall()
 
-            return {
-                "success": True,
-                "database_count": len(databases),
-                "databases": [dict(db) for db in databases],
-                "current_database": os.getenv("POSTGRES_DB", "postgres"),
-            }
+                return {
+                    "success": True,
+                    "database_count": len(databases),
+                    "databases": [dict(db) for db in databases],
+                    "current_database": os.getenv("POSTGRES_DB", "postgres"),
+                }
     except Exception as e:
         return {"success": False, "error": str(e)}
 
 
-@mcp.tool()
+@backend_tool("postgres")
+@instrument
 def postgres_create_database(database_name: str, owner: Optional[str] = None) -> dict:
     """
     Create a new Postgres database.
@@ -257,8 +622,6 @@ def postgres_create_database(database_name: str, owner: Optional[str] = None) ->
     """
     try:
         # Validate database name (alphanumeric and underscores only)
-        import re
-
         if not re.match(r"^[a-zA-Z0-9_]+$", database_name):
             return {
                 "success": False,
@@ -266,61 +629,70 @@ def postgres_create_database(database_name: str, owner: Optional[str] = None) ->
                 "database_name": database_name,
             }
 
-        conn = get_postgres_connection()
-        # Must be outside transaction for CREATE DATABASE
-        conn.autocommit = True
+        with postgres_connection() as conn:
+            # Must be outside transaction for CREATE DATABASE
+            # (postgres_connection() resets autocommit when the connection is returned)
+            conn.autocommit = True
 
-        with conn.cursor() as cur:
-            # Check if database already exists
-            cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (database_name,))
+            with conn.cursor() as cur:
+                # Check if database already exists
+                with phase("execute"):
+                    cur.execute("SELECT 1 FROM pg_database WHERE datname = %s", (database_name,))
+                with phase("fetch"):
+                    exists = cur.fetchone()
 
-            if cur.fetchone():
-                return {
-                    "success": False,
-                    "error": f"Database '{database_name}' already exists",
-                    "database_name": database_name,
-                    "tip": "Use postgres_list_databases() to see all databases",
-                }
-
-            # Create the database
-            if owner:
-                # Validate owner exists
-                cur.execute("SELECT 1 FROM pg_roles WHERE rolname = %s", (owner,))
-                if not cur.fetchone():
+                if exists:
                     return {
                         "success": False,
-                        "error": f"Owner '{owner}' does not exist",
+                        "error": f"Database '{database_name}' already exists",
                         "database_name": database_name,
+                        "tip": "Use postgres_list_databases() to see all databases",
                     }
-                # Use identifier quoting for safety
-                from psycopg2 import sql
-
-                cur.execute(
-                    sql.SQL("CREATE DATABASE {} OWNER {}").format(
-                        sql.Identifier(database_name), sql.Identifier(owner)
-                    )
-                )
-            else:
-                from psycopg2 import sql
-
-                cur.execute(sql.SQL("CREATE DATABASE {}").format(sql.Identifier(database_name)))
 
-        # Reset autocommit
-        conn.autocommit = False
-
-        return {
-            "success": True,
-            "message": f"Database '{database_name}' created successfully",
-            "database_name": database_name,
-            "owner": owner or os.getenv("POSTGRES_USER", "postgres"),
-            "tip": "To connect to this database, update POSTGRES_DB environment variable",
-        }
+                # Create the database
+                if owner:
+                    # Validate owner exists
+                    with phase("execute"):
+                        cur.execute("SELECT 1 FROM pg_roles WHERE rolname = %s", (owner,))
+                    with phase("fetch"):
+                        owner_exists = cur.fetchone()
+                    if not owner_exists:
+                        return {
+                            "success": False,
+                            "error": f"Owner '{owner}' does not exist",
+                            "database_name": database_name,
+                        }
+                    # Use identifier quoting for safety
+                    from psycopg2 import sql
+
+                    with phase("execute"):
+                        cur.execute(
+                            sql.SQL("CREATE DATABASE {} OWNER {}").format(
+                                sql.Identifier(database_name), sql.Identifier(owner)
+                            )
+                        )
+                else:
+                    from psycopg2 import sql
+
+                    with phase("execute"):
+                        cur.execute(
+                            sql.SQL("CREATE DATABASE {}").format(sql.Identifier(database_name))
+                        )
+
+            if SCHEMA_CACHE_TTL > 0:
+                try:
+                    SHARED_CACHE.invalidate("postgres_list_databases:")
+                except sqlite3.Error as e:
+                    # The database exists now; a stale listing is better than a false failure
+                    print(f"⚠️  Shared cache invalidation failed after CREATE DATABASE: {e}")
+            return {
+                "success": True,
+                "message": f"Database '{database_name}' created successfully",
+                "database_name": database_name,
+                "owner": owner or os.getenv("POSTGRES_USER", "postgres"),
+                "tip": "To connect to this database, update POSTGRES_DB environment variable",
+            }
     except Exception as e:
-        # Reset autocommit on error
-        try:
-            conn.autocommit = False
-        except:
-            pass
         return {
             "success": False,
             "error": str(e),
@@ -328,7 +700,9 @@ def postgres_create_database(database_name: str, owner: Optional[str] = None) ->
         }
 
 
-@mcp.tool()
+@backend_tool("postgres")
+@instrument
+@cached(SCHEMA_CACHE_TTL, "postgres")
 def postgres_list_tables(schema: str = "public") -> dict:
     """
     List all tables in the Postgres database.
@@ -343,34 +717,38 @@ def postgres_list_tables(schema: str = "public") -> dict:
     psql -h {POSTGRES_HOST} -U {POSTGRES_USER} -d {POSTGRES_DB} -c "\\dt"
     """
     try:
-        conn = get_postgres_connection()
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            # Get tables - simplified query without size calculation
-            cur.execute(
-                """
-                SELECT
-                    schemaname,
-                    tablename
-                FROM pg_tables
-                WHERE schemaname = %s
-                ORDER BY tablename
-            """,
-                (schema,),
-            )
+        with postgres_connection() as conn:
+            with conn.cursor(cursor_factory=real_dict_cursor()) as cur:
+                # Get tables - simplified query without size calculation
+                with phase("execute"):
+                    cur.execute(
+                        """
+                        SELECT
+                            schemaname,
+                            tablename
+                        FROM pg_tables
+                        WHERE schemaname = %s
+                        ORDER BY tablename
+                    """,
+                        (schema,),
+                    )
 
-            tables = cur.fetchall()
+                with phase("fetch"):
+                    tables = cur.fetchall()
 
-            return {
-                "success": True,
-                "schema": schema,
-                "table_count": len(tables),
-                "tables": [dict(t) for t in tables],
-            }
+                return {
+                    "success": True,
+                    "schema": schema,
+                    "table_count": len(tables),
+                    "tables": [dict(t) for t in tables],
+                }
     except Exception as e:
         return {"success": False, "error": str(e), "schema": schema}
 
 
-@mcp.tool()
+@backend_tool("postgres")
+@instrument
+@cached(SCHEMA_CACHE_TTL, "postgres")
 def postgres_describe_table(table_name: str, schema: str = "public") -> dict:
     """
     Get detailed schema information for a specific table.
@@ -386,37 +764,41 @@ def postgres_describe_table(table_name: str, schema: str = "public") -> dict:
     psql -h {POSTGRES_HOST} -U {POSTGRES_USER} -d {POSTGRES_DB} -c "\\d table_name"
     """
     try:
-        conn = get_postgres_connection()
-        with conn.cursor(cursor_factory=RealDictCursor) as cur:
-            # Get column information
-            cur.execute(
-                """
-                SELECT
-                    column_name,
-                    data_type,
-                    character_maximum_length,
-                    is_nullable,
-                    column_default
-                FROM information_schema.columns
-                WHERE table_schema = %s AND table_name = %s
-                ORDER BY ordinal_position
-            """,
-                (schema, table_name),
-            )
+        with postgres_connection() as conn:
+            with conn.cursor(cursor_factory=real_dict_cursor()) as cur:
+                # Get column information
+                with phase("execute"):
+                    cur.execute(
+                        """
+                        SELECT
+                            column_name,
+                            data_type,
+                            character_maximum_length,
+                            is_nullable,
+                            column_default
+                        FROM information_schema.columns
+                        WHERE table_schema = %s AND table_name = %s
+                        ORDER BY ordinal_position
+                    """,
+                        (schema, table_name),
+                    )
 
-            columns = cur.fetchall()
+                with phase("fetch"):
+                    columns = cur.fetchall()
 
-            # Get row count
-            cur.execute(f"SELECT COUNT(*) as count FROM {schema}.{table_name}")
-            row_count = cur.fetchone()["count"]
+                # Get row count
+                with phase("execute"):
+                    cur.execute(f"SELECT COUNT(*) as count FROM {schema}.{table_name}")
+                with phase("fetch"):
+                    row_count = cur.fetchone()["count"]
 
-            return {
-                "success": True,
-                "schema": schema,
-                "table": table_name,
-                "row_count": row_count,
-                "columns": [dict(c) for c in columns],
-            }
+                return {
+                    "success": True,
+                    "schema": schema,
+                    "table": table_name,
+                    "row_count": row_count,
+                    "columns": [dict(c) for c in columns],
+                }
     except Exception as e:
         return {"success": False, "error": str(e), "table": table_name}
 
@@ -426,7 +808,9 @@ def postgres_describe_table(table_name: str, schema: str = "public") -> dict:
 # =============================================================================
 
 
-@mcp.tool()
+@backend_tool("mysql")
+@instrument
+@cached(RESULT_CACHE_TTL, "mysql")
 def mysql_query(sql: str, limit: int = 100) -> dict:
     """
     Execute a SQL query against the MySQL database.
@@ -452,28 +836,34 @@ def mysql_query(sql: str, limit: int = 100) -> dict:
     limit = min(limit, 1000)
 
     try:
-        conn = get_mysql_connection()
-        cursor = conn.cursor(dictionary=True)
+        with mysql_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
 
-        # Add LIMIT if not present
-        if "LIMIT" not in sql.upper():
-            sql = f"{sql.rstrip(';')} LIMIT {limit}"
+            # Add LIMIT if not present
+            if "LIMIT" not in sql.upper():
+                sql = f"{sql.rstrip(';')} LIMIT {limit}"
 
-        cursor.execute(sql)
-        rows = cursor.fetchall()
-        cursor.close()
+            with track("mysql", sql) as execution:
+                with phase("execute"):
+                    cursor.execute(sql)
+                with phase("fetch"):
+                    rows = cursor.fetchall()
+                execution.rows = len(rows)
+            cursor.close()
 
-        return {
-            "success": True,
-            "row_count": len(rows),
-            "rows": rows,
-            "query": sql,
-        }
-    except MySQLError as e:
+            return {
+                "success": True,
+                "row_count": len(rows),
+                "rows": rows,
+                "query": sql,
+            }
+    except (mysql_error(), TimeoutError) as e:
         return {"success": False, "error": str(e), "query": sql}
 
 
-@mcp.tool()
+@backend_tool("mysql")
+@instrument
+@cached(SCHEMA_CACHE_TTL, "mysql")
 def mysql_list_tables(database: Optional[str] = None) -> dict:
     """
     List all tables in the MySQL database.
@@ -487,33 +877,37 @@ def mysql_list_tables(database: Optional[str] = None) -> dict:
     Equivalent command:
     mysql -h {MYSQL_HOST} -u {MYSQL_USER} -p -e "SHOW TABLES"
     """
-    try:
-        conn = get_mysql_connection()
-        cursor = conn.cursor(dictionary=True)
+    db_name = database or os.getenv("MYSQL_DATABASE", "maui_app_db")
 
-        db_name = database or os.getenv("MYSQL_DATABASE", "maui_app_db")
+    try:
+        with mysql_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
 
-        # Get tables
-        cursor.execute(f"SHOW TABLES FROM {db_name}")
-        tables = cursor.fetchall()
+            # Get tables
+            with phase("execute"):
+                cursor.execute(f"SHOW TABLES FROM {db_name}")
+            with phase("fetch"):
+                tables = cursor.fetchall()
 
-        # Extract table names from the result
-        table_key = f"Tables_in_{db_name}"
-        table_list = [table[table_key] for table in tables]
+            # Extract table names from the result
+            table_key = f"Tables_in_{db_name}"
+            table_list = [table[table_key] for table in tables]
 
-        cursor.close()
+            cursor.close()
 
-        return {
-            "success": True,
-            "database": db_name,
-            "table_count": len(table_list),
-            "tables": table_list,
-        }
-    except MySQLError as e:
+            return {
+                "success": True,
+                "database": db_name,
+                "table_count": len(table_list),
+                "tables": table_list,
+            }
+    except (mysql_error(), TimeoutError) as e:
         return {"success": False, "error": str(e), "database": db_name}
 
 
-@mcp.tool()
+@backend_tool("mysql")
+@instrument
+@cached(SCHEMA_CACHE_TTL, "mysql")
 def mysql_describe_table(table_name: str, database: Optional[str] = None) -> dict:
     """
     Get detailed schema information for a specific MySQL table.
@@ -529,29 +923,33 @@ def mysql_describe_table(table_name: str, database: Optional[str] = None) -> dic
     mysql -h {MYSQL_HOST} -u {MYSQL_USER} -p -e "DESCRIBE table_name"
     """
     try:
-        conn = get_mysql_connection()
-        cursor = conn.cursor(dictionary=True)
+        with mysql_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
 
-        db_name = database or os.getenv("MYSQL_DATABASE", "maui_app_db")
+            db_name = database or os.getenv("MYSQL_DATABASE", "maui_app_db")
 
-        # Get column information
-        cursor.execute(f"DESCRIBE {db_name}.{table_name}")
-        columns = cursor.fetchall()
+            # Get column information
+            with phase("execute"):
+                cursor.execute(f"DESCRIBE {db_name}.{table_name}")
+            with phase("fetch"):
+                columns = cursor.fetchall()
 
-        # Get row count
-        cursor.execute(f"SELECT COUNT(*) as count FROM {db_name}.{table_name}")
-        row_count = cursor.fetchone()["count"]
+            # Get row count
+            with phase("execute"):
+                cursor.execute(f"SELECT COUNT(*) as count FROM {db_name}.{table_name}")
+            with phase("fetch"):
+                row_count = cursor.fetchone()["count"]
 
-        cursor.close()
+            cursor.close()
 
-        return {
-            "success": True,
-            "database": db_name,
-            "table": table_name,
-            "row_count": row_count,
-            "columns": columns,
-        }
-    except MySQLError as e:
+            return {
+                "success": True,
+                "database": db_name,
+                "table": table_name,
+                "row_count": row_count,
+                "columns": columns,
+            }
+    except (mysql_error(), TimeoutError) as e:
         return {"success": False, "error": str(e), "table": table_name}
 
 
@@ -560,7 +958,8 @@ def mysql_describe_table(table_name: str, database: Optional[str] = None) -> dic
 # =============================================================================
 
 
-@mcp.tool()
+@backend_tool("qdrant")
+@instrument
 def qdrant_search(collection: str, query_text: str, limit: int = 5) -> dict:
     """
     Perform semantic vector search in a Qdrant collection.
@@ -580,11 +979,13 @@ def qdrant_search(collection: str, query_text: str, limit: int = 5) -> dict:
     curl http://{QDRANT_HOST}:{QDRANT_PORT}/collections/{collection}/points/search
     """
     try:
-        client = get_qdrant_client()
+        with phase("connect"):
+            client = get_qdrant_client()
 
         # NOTE: In production, you'd embed query_text here with an actual model
         # For now, return collection info as we can't embed without a model
-        collection_info = client.get_collection(collection_name=collection)
+        with phase("execute"):
+            collection_info = client.get_collection(collection_name=collection)
 
         return {
             "success": True,
@@ -601,7 +1002,9 @@ def qdrant_search(collection: str, query_text: str, limit: int = 5) -> dict:
         return {"success": False, "error": str(e), "collection": collection}
 
 
-@mcp.tool()
+@backend_tool("qdrant")
+@instrument
+@cached(SCHEMA_CACHE_TTL, "qdrant")
 def qdrant_list_collections() -> dict:
     """
     List all Qdrant vector collections.
@@ -613,13 +1016,16 @@ def qdrant_list_collections() -> dict:
     curl http://{QDRANT_HOST}:{QDRANT_PORT}/collections
     """
     try:
-        client = get_qdrant_client()
-        collections = client.get_collections()
+        with phase("connect"):
+            client = get_qdrant_client()
+        with phase("execute"):
+            collections = client.get_collections()
 
         collection_details = []
         for coll in collections.collections:
             try:
-                info = client.get_collection(collection_name=coll.name)
+                with phase("execute"):
+                    info = client.get_collection(collection_name=coll.name)
                 collection_details.append(
                     {
                         "name": coll.name,
@@ -640,7 +1046,9 @@ def qdrant_list_collections() -> dict:
         return {"success": False, "error": str(e)}
 
 
-@mcp.tool()
+@backend_tool("qdrant")
+@instrument
+@cached(SCHEMA_CACHE_TTL, "qdrant")
 def qdrant_collection_info(collection: str) -> dict:
     """
     Get detailed information about a specific Qdrant collection.
@@ -655,8 +1063,10 @@ def qdrant_collection_info(collection: str) -> dict:
     curl http://{QDRANT_HOST}:{QDRANT_PORT}/collections/{collection}
     """
     try:
-        client = get_qdrant_client()
-        info = client.get_collection(collection_name=collection)
+        with phase("connect"):
+            client = get_qdrant_client()
+        with phase("execute"):
+            info = client.get_collection(collection_name=collection)
 
         return {
             "success": True,
@@ -673,12 +1083,135 @@ def qdrant_collection_info(collection: str) -> dict:
         return {"success": False, "error": str(e), "collection": collection}
 
 
+# Exports are only written inside this directory
+QDRANT_EXPORT_DIR = os.getenv(
+    "QDRANT_EXPORT_DIR", os.path.join(tempfile.gettempdir(), "qdrant-exports")
+)
+
+
+def _point_to_dict(point) -> dict:
+    item = {"id": point.id, "payload": point.payload}
+    if point.vector is not None:
+        item["vector"] = point.vector
+    return item
+
+
+def _export_points(
+    scroll_page, export_path: str, start_offset: Optional[Any], max_points: Optional[int]
+) -> dict:
+    """Write every page from scroll_page(offset) to a JSONL file (gzip if it ends in .gz)."""
+    export_dir = os.path.realpath(QDRANT_EXPORT_DIR)
+    path = os.path.realpath(os.path.join(export_dir, export_path))
+    if not path.startswith(export_dir + os.sep):
+        raise ValueError(f"export_path must be a relative path inside {QDRANT_EXPORT_DIR}")
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+
+    # Written to a temporary file and renamed, so a failed export never leaves a partial file
+    tmp_path = f"{path}.tmp"
+    opener = gzip.open if path.endswith(".gz") else open
+    written, offset = 0, start_offset
+    try:
+        with opener(tmp_path, "wt", encoding="utf-8") as f:
+            while True:
+                points, offset = scroll_page(offset)
+                for point in points[: None if max_points is None else max_points - written]:
+                    f.write(json.dumps(_point_to_dict(point), default=str) + "\n")
+                    written += 1
+                if offset is None or (max_points is not None and written >= max_points):
+                    break
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+    return {"export_path": path, "point_count": written, "bytes": os.path.getsize(path)}
+
+
+@backend_tool("qdrant")
+@instrument
+def qdrant_scroll(
+    collection: str,
+    payload_filter: Optional[Dict[str, Any]] = None,
+    payload_fields: Optional[List[str]] = None,
+    with_vectors: bool = False,
+    limit: int = 100,
+    offset: Optional[Any] = None,
+    export_path: Optional[str] = None,
+    max_points: Optional[int] = None,
+) -> dict:
+    """
+    Page through the points of a Qdrant collection, or export them to a file.
+
+    Pass next_page_offset from the previous call as offset to continue. Vectors
+    are left out unless with_vectors=True, and payload_fields limits the payload
+    to the listed keys, so only the data needed crosses the network.
+
+    Args:
+        collection: Name of the collection
+        payload_filter: Qdrant filter, e.g.
+                        {"must": [{"key": "city", "match": {"value": "Paris"}}]}
+        payload_fields: Payload keys to return (default: all; [] for none)
+        with_vectors: Include vectors (default: False)
+        limit: Points per page (default: 100, max: 1000)
+        offset: next_page_offset returned by the previous call
+        export_path: Stream all matching points to this JSONL file (.gz to compress),
+                     relative to QDRANT_EXPORT_DIR, instead of returning them
+        max_points: Stop an export after this many points (default: no limit)
+
+    Returns:
+        dict: Points and next_page_offset, or the export file path and point count
+
+    Equivalent command:
+    curl -X POST http://{QDRANT_HOST}:{QDRANT_PORT}/collections/{collection}/points/scroll
+    """
+    limit = min(limit, 1000)
+    if payload_fields is None:
+        with_payload = True
+    else:
+        with_payload = list(payload_fields) or False
+
+    try:
+        with phase("connect"):
+            client = get_qdrant_client()
+        scroll_filter = None
+        if payload_filter:
+            scroll_filter = import_backend("qdrant_client.models").Filter(**payload_filter)
+
+        def scroll_page(page_offset):
+            with phase("fetch"):
+                return client.scroll(
+                    collection_name=collection,
+                    scroll_filter=scroll_filter,
+                    limit=limit,
+                    offset=page_offset,
+                    with_payload=with_payload,
+                    with_vectors=with_vectors,
+                )
+
+        if export_path:
+            export = _export_points(scroll_page, export_path, offset, max_points)
+            return {"success": True, "collection": collection, **export}
+
+        points, next_offset = scroll_page(offset)
+        return {
+            "success": True,
+            "collection": collection,
+            "point_count": len(points),
+            "points": [_point_to_dict(point) for point in points],
+            "next_page_offset": next_offset,
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e), "collection": collection}
+
+
 # =============================================================================
 # NEO4J TOOLS
 # =============================================================================
 
 
-@mcp.tool()
+@backend_tool("neo4j")
+@instrument
+@cached(RESULT_CACHE_TTL, "neo4j")
 def neo4j_query(cypher: str, limit: int = 100) -> dict:
     """
     Execute a Cypher query against the Neo4j graph database.
@@ -707,14 +1240,17 @@ def neo4j_query(cypher: str, limit: int = 100) -> dict:
     limit = min(limit, 1000)
 
     try:
-        driver = get_neo4j_driver()
-        with driver.session() as session:
+        with neo4j_transaction() as tx:
             # Add LIMIT if not present
             if "LIMIT" not in cypher_upper:
                 cypher = f"{cypher.rstrip(';')} LIMIT {limit}"
 
-            result = session.run(cypher)
-            records = [dict(record) for record in result]
+            with track("neo4j", cypher) as execution:
+                with phase("execute"):
+                    result = tx.run(cypher)
+                with phase("fetch"):
+                    records = [dict(record) for record in result]
+                execution.rows = len(records)
 
             return {
                 "success": True,
@@ -726,7 +1262,8 @@ def neo4j_query(cypher: str, limit: int = 100) -> dict:
         return {"success": False, "error": str(e), "query": cypher}
 
 
-@mcp.tool()
+@backend_tool("neo4j")
+@instrument
 def neo4j_list_nodes(label: Optional[str] = None, limit: int = 100) -> dict:
     """
     List nodes in the Neo4j graph database.
@@ -742,19 +1279,20 @@ def neo4j_list_nodes(label: Optional[str] = None, limit: int = 100) -> dict:
     cypher-shell -a {NEO4J_URI} -u {NEO4J_USER} "MATCH (n) RETURN n LIMIT 100"
     """
     try:
-        driver = get_neo4j_driver()
-        with driver.session() as session:
+        with neo4j_transaction() as tx:
             if label:
                 query = f"MATCH (n:{label}) RETURN n, labels(n) as labels LIMIT {limit}"
             else:
                 query = f"MATCH (n) RETURN n, labels(n) as labels LIMIT {limit}"
 
-            result = session.run(query)
+            with phase("execute"):
+                result = tx.run(query)
             nodes = []
-            for record in result:
-                node = dict(record["n"])
-                node["_labels"] = record["labels"]
-                nodes.append(node)
+            with phase("fetch"):
+                for record in result:
+                    node = dict(record["n"])
+                    node["_labels"] = record["labels"]
+                    nodes.append(node)
 
             return {
                 "success": True,
@@ -766,7 +1304,8 @@ def neo4j_list_nodes(label: Optional[str] = None, limit: int = 100) -> dict:
         return {"success": False, "error": str(e), "label": label}
 
 
-@mcp.tool()
+@backend_tool("neo4j")
+@instrument
 def neo4j_get_relationships(node_label: Optional[str] = None, limit: int = 50) -> dict:
     """
     Get relationships in the Neo4j graph.
@@ -782,8 +1321,7 @@ def neo4j_get_relationships(node_label: Optional[str] = None, limit: int = 50) -
     cypher-shell -a {NEO4J_URI} -u {NEO4J_USER} "MATCH (a)-[r]->(b) RETURN a,r,b LIMIT 50"
     """
     try:
-        driver = get_neo4j_driver()
-        with driver.session() as session:
+        with neo4j_transaction() as tx:
             if node_label:
                 query = f"""
                 MATCH (a:{node_label})-[r]->(b)
@@ -797,18 +1335,20 @@ def neo4j_get_relationships(node_label: Optional[str] = None, limit: int = 50) -
                 LIMIT {limit}
                 """
 
-            result = session.run(query)
+            with phase("execute"):
+                result = tx.run(query)
             relationships = []
-            for record in result:
-                relationships.append(
-                    {
-                        "start_node": dict(record["a"]),
-                        "start_labels": record["start_labels"],
-                        "relationship_type": record["rel_type"],
-                        "end_node": dict(record["b"]),
-                        "end_labels": record["end_labels"],
-                    }
-                )
+            with phase("fetch"):
+                for record in result:
+                    relationships.append(
+                        {
+                            "start_node": dict(record["a"]),
+                            "start_labels": record["start_labels"],
+                            "relationship_type": record["rel_type"],
+                            "end_node": dict(record["b"]),
+                            "end_labels": record["end_labels"],
+                        }
+                    )
 
             return {
                 "success": True,
@@ -819,31 +1359,772 @@ def neo4j_get_relationships(node_label: Optional[str] = None, limit: int = 50) -
         return {"success": False, "error": str(e)}
 
 
+# =============================================================================
+# CROSS-BACKEND TOOLS
+# =============================================================================
+
+# Tools that modify a backend are never dispatched by multi_query
+WRITE_TOOLS = {"postgres_create_database"}
+
+MULTI_QUERY_MAX_REQUESTS = 20
+
+# Shared by multi_query and hybrid_search; calls that time out keep their thread
+# until the backend call returns, so size this above the expected fan-out (never
+# below one full multi_query call)
+_fanout_executor = ThreadPoolExecutor(
+    max_workers=max(MULTI_QUERY_MAX_REQUESTS, int(os.getenv("MULTI_QUERY_WORKERS", "32"))),
+    thread_name_prefix="fanout",
+)
+
+
+def _timed_call(fn: Callable[..., dict], args: Dict[str, Any]):
+    start = time.perf_counter()
+    result = fn(**args)
+    return result, time.perf_counter() - start
+
+
+@cross_backend_tool()
+@instrument
+def multi_query(requests: List[Dict[str, Any]], timeout: float = 30.0) -> dict:
+    """
+    Run several read-only tool calls across backends concurrently in one round trip.
+
+    Each sub-request names a backend tool and its arguments, for example:
+        [
+            {"tool": "postgres_query", "args": {"sql": "SELECT * FROM users", "limit": 10}},
+            {"tool": "mysql_query", "args": {"sql": "SELECT * FROM orders"}, "timeout": 5},
+            {"tool": "neo4j_query", "args": {"cypher": "MATCH (n:Person) RETURN n"}},
+        ]
+    Wall time is that of the slowest sub-request instead of the sum of all of them.
+
+    Args:
+        requests: Sub-requests with "tool", "args" and optional "timeout" (seconds) and
+                  "id" (echoed back); at most 20, write tools are not allowed
+        timeout: Default per-sub-request timeout in seconds (default: 30)
+
+    Returns:
+        dict: One entry per sub-request, in request order, with status (ok, error,
+              timeout), elapsed_ms and the tool result or error
+    """
+    if not requests:
+        return {"success": False, "error": "requests must contain at least one sub-request"}
+    if len(requests) > MULTI_QUERY_MAX_REQUESTS:
+        return {
+            "success": False,
+            "error": f"At most {MULTI_QUERY_MAX_REQUESTS} sub-requests per call",
+        }
+
+    start = time.perf_counter()
+    results: List[dict] = []
+    pending = {}
+    for index, request in enumerate(requests):
+        if not isinstance(request, dict):
+            results.append({"index": index, "status": "error", "error": "Expected an object"})
+            continue
+
+        name = request.get("tool")
+        item = {"index": index, "tool": name}
+        if "id" in request:
+            item["id"] = request["id"]
+        results.append(item)
+
+        args = request.get("args") or {}
+        fn = TOOL_FUNCTIONS.get(name)
+        try:
+            item_timeout = float(request.get("timeout", timeout))
+        except (TypeError, ValueError):
+            item_timeout = None
+        if fn is None or name in WRITE_TOOLS:
+            item.update(status="error", error=f"Unknown or non-read-only tool: {name}")
+        elif not isinstance(args, dict):
+            item.update(status="error", error="args must be an object")
+        elif item_timeout is None or not 0 < item_timeout < float("inf"):
+            item.update(status="error", error="timeout must be a positive number of seconds")
+        else:
+            pending[index] = (_fanout_executor.submit(_timed_call, fn, args), item_timeout)
+
+    # Wait on the earliest deadlines first so every sub-request gets its own timeout
+    for index, (future, item_timeout) in sorted(pending.items(), key=lambda p: p[1][1]):
+        item = results[index]
+        remaining = max(0.0, start + item_timeout - time.perf_counter())
+        try:
+            result, elapsed = future.result(timeout=remaining)
+        except FutureTimeoutError:
+            future.cancel()  # drops it if it never started
+            item.update(status="timeout", error=f"No result within {item_timeout}s")
+            continue
+        except Exception as e:  # e.g. unexpected arguments
+            item.update(status="error", error=str(e))
+            continue
+
+        failed = isinstance(result, dict) and (result.get("success") is False or "error" in result)
+        item.update(
+            status="error" if failed else "ok", elapsed_ms=round(elapsed * 1000, 1), result=result
+        )
+
+    ok_count = sum(1 for item in results if item.get("status") == "ok")
+    return {
+        "success": True,
+        "request_count": len(results),
+        "ok_count": ok_count,
+        "failed_count": len(results) - ok_count,
+        "wall_ms": round((time.perf_counter() - start) * 1000, 1),
+        "results": results,
+    }
+
+
+# Memory for a federated join's hash table before it spills to FEDERATED_JOIN_SPILL_DIR
+FEDERATED_JOIN_MEMORY_MB = float(os.getenv("FEDERATED_JOIN_MEMORY_MB", "64"))
+FEDERATED_JOIN_SPILL_DIR = os.getenv("FEDERATED_JOIN_SPILL_DIR")  # default: system temp dir
+FEDERATED_JOIN_FETCH_SIZE = int(os.getenv("FEDERATED_JOIN_FETCH_SIZE", "1000"))
+FEDERATED_JOIN_PUSHDOWN_BATCH = int(os.getenv("FEDERATED_JOIN_PUSHDOWN_BATCH", "500"))
+
+_IDENTIFIER_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_]*$")
+
+
+def _stream_rows(backend: str, sql: str, params: Optional[list] = None):
+    """
+    Yield result batches of FEDERATED_JOIN_FETCH_SIZE rows without loading the
+    whole result: a server-side cursor on Postgres, an unbuffered cursor on MySQL.
+    """
+    if backend == "postgres":
+        with postgres_connection() as conn:
+            with conn.cursor(name="federated_join", cursor_factory=real_dict_cursor()) as cur:
+                cur.itersize = FEDERATED_JOIN_FETCH_SIZE
+                with track("postgres", sql) as execution:
+                    cur.execute(sql, params)
+                    while rows := cur.fetchmany(FEDERATED_JOIN_FETCH_SIZE):
+                        execution.rows += len(rows)
+                        yield [dict(row) for row in rows]
+    else:
+        with mysql_connection() as conn:
+            cursor = conn.cursor(dictionary=True)
+            try:
+                with track("mysql", sql) as execution:
+                    cursor.execute(sql, params)
+                    while rows := cursor.fetchmany(FEDERATED_JOIN_FETCH_SIZE):
+                        execution.rows += len(rows)
+                        yield rows
+            finally:
+                # Rows left unread when the join stops early must be drained
+                # before the connection goes back to the pool
+                if conn.unread_result:
+                    conn.consume_results()
+                cursor.close()
+
+
+def _pushdown_batches(
+    backend: str, sql: str, key_columns: List[str], key_batches: Iterable[List[tuple]]
+):
+    """Run sql once per batch of join keys, filtered to those keys, yielding row batches."""
+    quote = '"{}"' if backend == "postgres" else "`{}`"
+    columns = ", ".join(quote.format(c) for c in key_columns)
+    placeholder = "(" + ", ".join(["%s"] * len(key_columns)) + ")"
+    inner = sql.strip().rstrip(";")
+    if backend == "postgres":
+        # psycopg2 binds with %s and reads %% as a literal %. mysql.connector only
+        # replaces %s and would pass %% through, so MySQL queries are left as is
+        # (federated_join rejects a literal %s in them)
+        inner = inner.replace("%", "%%")
+
+    for batch in key_batches:
+        filtered = (
+            f"SELECT * FROM ({inner}) AS federated_join_side "
+            f"WHERE ({columns}) IN ({', '.join([placeholder] * len(batch))})"
+        )
+        yield from _stream_rows(backend, filtered, [value for key in batch for value in key])
+
+
+@cross_backend_tool("postgres", "mysql")
+@instrument
+def federated_join(
+    left_sql: str,
+    right_sql: str,
+    left_key: str,
+    right_key: Optional[str] = None,
+    left_backend: str = "postgres",
+    right_backend: str = "mysql",
+    join_type: str = "inner",
+    pushdown: bool = False,
+    limit: int = 100,
+) -> dict:
+    """
+    Join the results of a Postgres and a MySQL query inside the hub.
+
+    Both queries are streamed (no row limit is added to them) and only joined
+    rows are returned. The hash table is built on whichever side turns out to
+    be smaller and spills to disk past FEDERATED_JOIN_MEMORY_MB. With
+    pushdown=True the left side is read first and the right query is run in
+    batches filtered to the left side's join keys, e.g.
+    SELECT * FROM (right_sql) AS federated_join_side WHERE (key) IN (...).
+
+    Args:
+        left_sql: SELECT query for the left side
+        right_sql: SELECT query for the right side
+        left_key: Join column(s) of the left side, comma-separated for composite keys
+        right_key: Join column(s) of the right side (default: same as left_key)
+        left_backend: Backend of left_sql - postgres or mysql (default: postgres)
+        right_backend: Backend of right_sql - postgres or mysql (default: mysql)
+        join_type: inner or left (default: inner)
+        pushdown: Filter the right query by the left side's keys (default: False)
+        limit: Maximum number of joined rows to return (default: 100, max: 1000)
+
+    Returns:
+        dict: Joined rows (clashing right-side columns get a _right suffix) and join stats
+
+    Equivalent command:
+    No single-command equivalent; replaces exporting both results and joining them by hand
+    """
+    left_keys = [k.strip() for k in left_key.split(",")]
+    right_keys = [k.strip() for k in (right_key or left_key).split(",")]
+
+    errors = []
+    for sql in (left_sql, right_sql):
+        if not sql.strip().upper().startswith("SELECT"):
+            errors.append("Only SELECT queries are allowed for safety")
+    for backend in (left_backend, right_backend):
+        if backend not in ("postgres", "mysql"):
+            errors.append(f"Unsupported backend '{backend}' (expected postgres or mysql)")
+    if len(left_keys) != len(right_keys):
+        errors.append("left_key and right_key must name the same number of columns")
+    if pushdown and not all(_IDENTIFIER_RE.match(k) for k in right_keys):
+        errors.append("right_key must be plain column names when pushdown is enabled")
+    if pushdown and right_backend == "mysql" and "%s" in right_sql:
+        errors.append(
+            "right_sql must not contain '%s' when pushdown is enabled on MySQL "
+            "(it would be taken for a key placeholder); write e.g. CONCAT('%', 'smith')"
+        )
+    if join_type not in JOIN_TYPES:
+        errors.append(f"join_type must be one of: {', '.join(JOIN_TYPES)}")
+    if errors:
+        return {"success": False, "error": "; ".join(dict.fromkeys(errors))}
+
+    limit = min(limit, 1000)
+    memory_limit = int(FEDERATED_JOIN_MEMORY_MB * 2**20)
+    streams = []
+    join = None
+
+    try:
+        if pushdown:
+            left_stream = _stream_rows(left_backend, left_sql)
+            streams.append(left_stream)
+            join = HashJoin(
+                left_keys,
+                right_keys,
+                "left",
+                join_type,
+                memory_limit,
+                spill_dir=FEDERATED_JOIN_SPILL_DIR,
+            )
+            with phase("execute"):
+                for batch in left_stream:
+                    join.add(batch)
+            # Keys come from the (possibly spilled) hash table, not a separate in-memory set
+            key_batches = join.key_batches(FEDERATED_JOIN_PUSHDOWN_BATCH)
+            right_stream = _pushdown_batches(right_backend, right_sql, right_keys, key_batches)
+            streams.append(right_stream)
+            probe_rows = chain.from_iterable(right_stream)
+        else:
+            left_stream = _stream_rows(left_backend, left_sql)
+            right_stream = _stream_rows(right_backend, right_sql)
+            streams += [left_stream, right_stream]
+            with phase("execute"):
+                build_side, build_rows, probe_rows = pick_build_side(
+                    left_stream, right_stream, memory_limit
+                )
+                join = HashJoin(
+                    left_keys if build_side == "left" else right_keys,
+                    right_keys if build_side == "left" else left_keys,
+                    build_side,
+                    join_type,
+                    memory_limit,
+                    spill_dir=FEDERATED_JOIN_SPILL_DIR,
+                )
+                join.add(build_rows)
+
+        with phase("fetch"):
+            # One extra row tells us whether the result was truncated
+            rows = list(islice(chain(join.probe(probe_rows), join.finish()), limit + 1))
+
+        return {
+            "success": True,
+            "row_count": min(len(rows), limit),
+            "truncated": len(rows) > limit,
+            "rows": rows[:limit],
+            "join": {**join.stats, "join_type": join_type, "pushdown": pushdown},
+            "query": {
+                "left": {"backend": left_backend, "sql": left_sql, "key": left_keys},
+                "right": {"backend": right_backend, "sql": right_sql, "key": right_keys},
+            },
+        }
+    except Exception as e:
+        return {"success": False, "error": str(e)}
+    finally:
+        # Stops unfinished queries and returns their connections to the pools
+        for stream in streams:
+            stream.close()
+        if join is not None:
+            join.close()
+
+
+HYBRID_SEARCH_MODES = ("fulltext", "trigram")
+HYBRID_SEARCH_LANGUAGE = os.getenv("HYBRID_SEARCH_LANGUAGE", "english")
+
+
+def _vector_hits(
+    collection: str, query_vector: List[float], candidates: int, id_payload_field: Optional[str]
+) -> List[tuple]:
+    """Ranked (id, score) pairs from Qdrant; ids come from a payload field if given."""
+    with phase("connect"):
+        client = get_qdrant_client()
+    with_payload = [id_payload_field] if id_payload_field else False
+    with phase("execute"):
+        if hasattr(client, "query_points"):  # qdrant-client >= 1.10
+            points = client.query_points(
+                collection_name=collection,
+                query=query_vector,
+                limit=candidates,
+                with_payload=with_payload,
+            ).points
+        else:
+            points = client.search(
+                collection_name=collection,
+                query_vector=query_vector,
+                limit=candidates,
+                with_payload=with_payload,
+            )
+
+    hits = []
+    for point in points:
+        item_id = (point.payload or {}).get(id_payload_field) if id_payload_field else point.id
+        if item_id is not None:
+            hits.append((str(item_id), point.score))
+    return hits
+
+
+def _text_hits(
+    schema: str,
+    table: str,
+    id_column: str,
+    text_columns: List[str],
+    query_text: str,
+    mode: str,
+    candidates: int,
+    tsvector_column: Optional[str] = None,
+) -> List[tuple]:
+    """Ranked (id, score) pairs from Postgres full-text or trigram search."""
+    columns = [f'"{c}"::text' for c in text_columns]
+    params = {"language": HYBRID_SEARCH_LANGUAGE, "query": query_text, "limit": candidates}
+    if mode == "fulltext":
+        if tsvector_column:
+            # A stored tsvector column (and its GIN index) avoids computing to_tsvector per row
+            document = f'"{tsvector_column}"'
+        else:
+            # Matches a GIN index on the same to_tsvector(...) expression if there is one
+            document = f"to_tsvector(%(language)s::regconfig, concat_ws(' ', {', '.join(columns)}))"
+        tsquery = "websearch_to_tsquery(%(language)s::regconfig, %(query)s)"
+        score, condition = f"ts_rank_cd({document}, {tsquery})", f"{document} @@ {tsquery}"
+    else:
+        # pg_trgm; %% is the escaped similarity operator
+        score = f"GREATEST({', '.join(f'similarity({c}, %(query)s)' for c in columns)})"
+        condition = " OR ".join(f"{c} %% %(query)s" for c in columns)
+    sql = (
+        f'SELECT "{id_column}" AS id, {score} AS score FROM "{schema}"."{table}" '
+        f"WHERE {condition} ORDER BY score DESC LIMIT %(limit)s"
+    )
+
+    with postgres_connection() as conn:
+        with conn.cursor(cursor_factory=real_dict_cursor()) as cur:
+            with track("postgres", sql) as execution:
+                cur.execute(sql, params)
+                rows = cur.fetchall()
+                execution.rows = len(rows)
+    return [(str(row["id"]), float(row["score"])) for row in rows]
+
+
+def _hydrate_rows(schema: str, table: str, id_column: str, ids: List[str]):
+    """Fetch the Postgres rows for ids in one query, keyed by id as a string."""
+    with postgres_connection() as conn:
+        with conn.cursor(cursor_factory=real_dict_cursor()) as cur:
+            # Ids arrive as strings (from Qdrant or the text search); cast them to the column type
+            cur.execute(
+                "SELECT udt_name FROM information_schema.columns "
+                "WHERE table_schema = %s AND table_name = %s AND column_name = %s",
+                (schema, table, id_column),
+            )
+            column = cur.fetchone()
+            if column is None:
+                raise ValueError(f"Column {schema}.{table}.{id_column} does not exist")
+            sql = (
+                f'SELECT * FROM "{schema}"."{table}" '
+                f'WHERE "{id_column}" = ANY(%s::{column["udt_name"]}[])'
+            )
+            with track("postgres", sql) as execution:
+                cur.execute(sql, (ids,))
+                rows = cur.fetchall()
+                execution.rows = len(rows)
+    return {str(row[id_column]): dict(row) for row in rows}
+
+
+@cross_backend_tool("qdrant", "postgres")
+@instrument
+def hybrid_search(
+    query_text: str,
+    collection: str,
+    table: str,
+    query_vector: Optional[List[float]] = None,
+    text_columns: str = "content",
+    tsvector_column: Optional[str] = None,
+    id_column: str = "id",
+    id_payload_field: Optional[str] = None,
+    schema: str = "public",
+    mode: str = "fulltext",
+    fusion: str = "rrf",
+    vector_weight: float = 0.5,
+    limit: int = 10,
+    candidates: int = 50,
+    timeout: float = 10.0,
+) -> dict:
+    """
+    Hybrid retrieval: Qdrant vector search and Postgres text search in one call.
+
+    Both searches run concurrently, their rankings are fused and the top hits
+    are hydrated with their Postgres rows in a single WHERE id = ANY(...) query.
+    Qdrant point ids (or the id_payload_field payload value) must match the
+    table's id_column. The hub has no embedding model, so the caller passes the
+    embedding of query_text as query_vector; without it only text search runs.
+
+    Args:
+        query_text: Search text (websearch syntax for fulltext, e.g. "cat -dog")
+        collection: Qdrant collection to search
+        table: Postgres table holding the documents
+        query_vector: Embedding of query_text for the collection's vector space
+        text_columns: Comma-separated text columns to search (default: content)
+        tsvector_column: Stored tsvector column to match and rank in fulltext mode
+                         (default: none, to_tsvector over text_columns)
+        id_column: Primary key column of the table (default: id)
+        id_payload_field: Payload field holding the table id (default: the point id)
+        schema: Schema name (default: public)
+        mode: fulltext (tsvector) or trigram (pg_trgm) (default: fulltext)
+        fusion: rrf (reciprocal rank fusion) or weighted (normalized scores) (default: rrf)
+        vector_weight: Weight of the vector ranking, 0-1; text gets the rest (default: 0.5)
+        limit: Number of fused results to return (default: 10, max: 100)
+        candidates: Hits fetched from each side before fusion (default: 50, max: 500)
+        timeout: Seconds to wait for each side; a side that times out is skipped (default: 10)
+
+    Returns:
+        dict: Fused results with score, per-side ranks and the hydrated Postgres row
+
+    Equivalent command:
+    curl .../collections/{collection}/points/query + psql -c "SELECT ... WHERE tsv @@ ..."
+    """
+    columns = [c.strip() for c in text_columns.split(",") if c.strip()]
+    errors = []
+    identifiers = [schema, table, id_column, *columns]
+    if tsvector_column:
+        identifiers.append(tsvector_column)
+    if not all(_IDENTIFIER_RE.match(name) for name in identifiers):
+        errors.append(
+            "schema, table, id_column, text_columns and tsvector_column must be plain identifiers"
+        )
+    if not columns:
+        errors.append("text_columns must name at least one column")
+    if mode not in HYBRID_SEARCH_MODES:
+        errors.append(f"mode must be one of: {', '.join(HYBRID_SEARCH_MODES)}")
+    if tsvector_column and mode != "fulltext":
+        errors.append("tsvector_column requires mode=fulltext")
+    if fusion not in FUSION_METHODS:
+        errors.append(f"fusion must be one of: {', '.join(FUSION_METHODS)}")
+    if not 0 <= vector_weight <= 1:
+        errors.append("vector_weight must be between 0 and 1")
+    if errors:
+        return {"success": False, "error": "; ".join(errors)}
+
+    limit = min(limit, 100)
+    candidates = max(min(candidates, 500), limit)
+    warnings = []
+
+    start = time.perf_counter()
+    with phase("execute"):
+        text_future = _fanout_executor.submit(
+            _text_hits,
+            schema,
+            table,
+            id_column,
+            columns,
+            query_text,
+            mode,
+            candidates,
+            tsvector_column,
+        )
+        vector_future = None
+        if query_vector:
+            vector_future = _fanout_executor.submit(
+                _vector_hits, collection, query_vector, candidates, id_payload_field
+            )
+        else:
+            warnings.append("No query_vector given: vector search skipped")
+
+        searches = {"text": text_future}
+        if vector_future is not None:
+            searches["vector"] = vector_future
+
+        ranked = {}
+        for name, future in searches.items():
+            try:
+                remaining = max(0.0, start + timeout - time.perf_counter())
+                result = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                warnings.append(f"{name} search timed out after {timeout}s")
+                continue
+            except Exception as e:
+                warnings.append(f"{name} search failed: {e}")
+                continue
+            ranked[name] = result
+
+    if not ranked:
+        error = "Both searches failed" if len(searches) > 1 else "Text search failed"
+        return {"success": False, "error": error, "warnings": warnings}
+
+    weights = {"vector": vector_weight, "text": 1 - vector_weight}
+    fused = fuse(ranked, weights, fusion)[:limit]
+
+    rows = {}
+    if fused:
+        with phase("fetch"):
+            try:
+                rows = _hydrate_rows(schema, table, id_column, [r["id"] for r in fused])
+            except Exception as e:
+                warnings.append(f"Hydrating rows failed: {e}")
+
+    result = {
+        "success": True,
+        "row_count": len(fused),
+        "fusion": fusion,
+        "mode": mode,
+        "candidates": {name: len(hits) for name, hits in ranked.items()},
+        "results": [{**item, "row": rows.get(item["id"])} for item in fused],
+    }
+    if warnings:
+        result["warnings"] = warnings
+    return result
+
+
+# =============================================================================
+# DIAGNOSTIC TOOLS
+# =============================================================================
+
+
+@mcp.tool()
+@instrument
+def query_stats(
+    top_n: int = 10,
+    order_by: str = "total_time",
+    backend: Optional[str] = None,
+    include_slow: bool = True,
+) -> dict:
+    """
+    Show the most expensive query patterns executed through this hub.
+
+    Queries from postgres_query, mysql_query and neo4j_query are normalized into
+    fingerprints (literals stripped) and aggregated in memory by the worker
+    process that served this call (see process_id when WORKERS > 1).
+
+    Args:
+        top_n: Number of fingerprints to return (default: 10, max: 100)
+        order_by: Sort key - total_time, p95, calls, mean or errors (default: total_time)
+        backend: Optional backend filter (postgres, mysql, neo4j)
+        include_slow: Include the most recent slow queries (default: True)
+
+    Returns:
+        dict: Top fingerprints with call count, total/mean/p95 latency, rows and errors
+    """
+    if order_by not in ORDER_BY_FIELDS:
+        return {
+            "success": False,
+            "error": f"order_by must be one of: {', '.join(ORDER_BY_FIELDS)}",
+        }
+
+    top_n = min(top_n, 100)
+    result = {
+        "success": True,
+        "order_by": order_by,
+        "process_id": os.getpid(),
+        "summary": QUERY_LOG.summary(),
+        "fingerprints": QUERY_LOG.top(top_n, order_by, backend),
+    }
+    if include_slow:
+        result["slow_queries"] = QUERY_LOG.slow_queries(top_n, backend)
+    return result
+
+
+# =============================================================================
+# HTTP ENDPOINTS
+# =============================================================================
+
+
+@mcp.custom_route("/ready", methods=["GET"])
+async def readiness_endpoint(request: Request) -> JSONResponse:
+    """Kubernetes readiness probe: 503 until startup warm-up has finished."""
+    return JSONResponse(
+        {"ready": _ready.is_set(), "warmup": WARMUP_RESULTS},
+        status_code=200 if _ready.is_set() else 503,
+    )
+
+
+@mcp.custom_route("/metrics", methods=["GET"])
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus scrape endpoint (served alongside /sse)."""
+    return Response(render_metrics(), media_type=METRICS_CONTENT_TYPE)
+
+
+# =============================================================================
+# HTTP APP
+# =============================================================================
+
+# sse: long-lived SSE sessions (needs session affinity with several replicas)
+# streamable-http: one HTTP request per MCP message, load-balanced per call
+# both: serve /sse and /mcp from the same port
+TRANSPORTS = ("sse", "streamable-http", "both")
+MCP_TRANSPORT = os.getenv("MCP_TRANSPORT", "sse").lower()
+MCP_HTTP_PATH = os.getenv("MCP_HTTP_PATH", "/mcp")
+MCP_STATELESS_HTTP = os.getenv("MCP_STATELESS_HTTP", "true").lower() == "true"
+COMPRESSION_MIN_BYTES = int(os.getenv("COMPRESSION_MIN_BYTES", "1024"))
+
+# Worker processes sharing the port; each has its own connection pools. SSE sessions
+# live in one process, so several workers need stateless streamable HTTP.
+WORKERS = int(os.getenv("WORKERS", "1"))
+
+
+def start_background_tasks() -> None:
+    """Start the query stats dump and (optionally) warm-up in this process."""
+    start_dump_thread(per_process=WORKERS > 1)
+
+    # Optionally pre-open pooled connections before reporting ready
+    if os.getenv("WARMUP_ON_STARTUP", "false").lower() == "true":
+        print(f"🔥 Warming up backends (pid {os.getpid()}): {', '.join(ENABLED_BACKENDS)}")
+        start_warm_up()
+    else:
+        _ready.set()
+
+
+def create_app():
+    """
+    Build the ASGI app for MCP_TRANSPORT.
+
+    Streamable HTTP runs stateless with plain JSON responses by default, so any
+    replica can answer any call and large tool results can be compressed
+    (zstd/gzip, see compression.py). SSE streams are never compressed.
+
+    Uvicorn calls this factory once in every worker process, so per-process
+    background tasks are started here.
+    """
+    if MCP_TRANSPORT not in TRANSPORTS:
+        raise ValueError(f"MCP_TRANSPORT must be one of {', '.join(TRANSPORTS)}")
+
+    start_background_tasks()
+
+    middleware = [Middleware(CompressionMiddleware, minimum_size=COMPRESSION_MIN_BYTES)]
+
+    if MCP_TRANSPORT == "sse":
+        return mcp.http_app(transport="sse", middleware=middleware)
+
+    app = mcp.http_app(
+        path=MCP_HTTP_PATH,
+        transport="streamable-http",
+        stateless_http=MCP_STATELESS_HTTP,
+        json_response=MCP_STATELESS_HTTP,
+        middleware=middleware,
+    )
+    if MCP_TRANSPORT == "both":
+        # Add the SSE endpoints; custom routes (/metrics, /ready) are already present
+        sse_app = mcp.http_app(transport="sse")
+        existing = {getattr(route, "path", None) for route in app.routes}
+        app.router.routes.extend(r for r in sse_app.routes if r.path not in existing)
+    return app
+
+
 # =============================================================================
 # SERVER STARTUP
 # =============================================================================
 
+MODULE_LOAD_TIME = time.perf_counter() - _MODULE_LOAD_START
+
 if __name__ == "__main__":
+    port = int(os.getenv("MCP_PORT", "8000"))
+    if WORKERS > 1 and (MCP_TRANSPORT != "streamable-http" or not MCP_STATELESS_HTTP):
+        raise ValueError(
+            "WORKERS > 1 requires MCP_TRANSPORT=streamable-http with MCP_STATELESS_HTTP=true "
+            "(SSE and stateful sessions are bound to the worker process that opened them)"
+        )
+    if WORKERS > 1 and not os.getenv("SHARED_CACHE_PATH"):
+        # One cache file per deployment, inherited by the workers spawned below
+        cache_dir = tempfile.mkdtemp(prefix="mcp-hub-cache-")
+        atexit.register(shutil.rmtree, cache_dir, ignore_errors=True)
+        SHARED_CACHE.path = os.path.join(cache_dir, "cache.sqlite3")
+        os.environ["SHARED_CACHE_PATH"] = SHARED_CACHE.path
+    labels = {"postgres": "Postgres", "mysql": "MySQL", "qdrant": "Qdrant", "neo4j": "Neo4j"}
+    endpoints = {
+        "postgres": f"{os.getenv('POSTGRES_HOST')}:{os.getenv('POSTGRES_PORT')}",
+        "mysql": f"{os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}",
+        "qdrant": f"{os.getenv('QDRANT_HOST')}:{os.getenv('QDRANT_PORT')}",
+        "neo4j": os.getenv("NEO4J_URI"),
+    }
+
     print("=" * 70)
     print("🔌 bigtorig-mcp-hub - Phase 2: Database Integration")
     print("=" * 70)
-    print(f"📊 Total tools: 16")
-    print(f"   • Foundational: 2 tools (health_check, list_services)")
-    print(
-        f"   • Postgres: 5 tools (list_databases, create_database, query, list_tables, describe_table)"
-    )
-    print(f"   • MySQL: 3 tools (query, list_tables, describe_table)")
-    print(f"   • Qdrant: 3 tools (search, list_collections, collection_info)")
-    print(f"   • Neo4j: 3 tools (query, list_nodes, get_relationships)")
+    backend_tool_count = sum(len(tools) for tools in BACKEND_TOOLS.values())
+    print(f"📊 Total tools: {3 + backend_tool_count + len(CROSS_BACKEND_TOOLS)}")
+    print("   • Foundational: 2 tools (health_check, list_services)")
+    print("   • Diagnostics: 1 tool (query_stats)")
+    for backend, tools in BACKEND_TOOLS.items():
+        short_names = ", ".join(t.removeprefix(f"{backend}_") for t in tools)
+        print(f"   • {labels[backend]}: {len(tools)} tools ({short_names})")
+    cross_names = ", ".join(CROSS_BACKEND_TOOLS)
+    print(f"   • Cross-backend: {len(CROSS_BACKEND_TOOLS)} tools ({cross_names})")
+    disabled = [b for b in ALL_BACKENDS if b not in ENABLED_BACKENDS]
+    if disabled:
+        print(f"   • Disabled backends: {', '.join(disabled)}")
+    print()
+    print("🔗 Database connections:")
+    for backend in ENABLED_BACKENDS:
+        print(f"   • {labels[backend]}: {endpoints[backend]}")
     print()
-    print(f"🔗 Database connections:")
-    print(f"   • Postgres: {os.getenv('POSTGRES_HOST')}:{os.getenv('POSTGRES_PORT')}")
-    print(f"   • MySQL: {os.getenv('MYSQL_HOST')}:{os.getenv('MYSQL_PORT')}")
-    print(f"   • Qdrant: {os.getenv('QDRANT_HOST')}:{os.getenv('QDRANT_PORT')}")
-    print(f"   • Neo4j: {os.getenv('NEO4J_URI')}")
+    print("⏱️  Startup import time:")
+    print(f"   • Core (fastmcp, starlette, prometheus_client): {MODULE_LOAD_TIME * 1000:.1f} ms")
+    for module_name, seconds in IMPORT_TIMES.items():
+        print(f"   • {module_name}: {seconds * 1000:.1f} ms")
+    print("   • Backend client libraries: imported on first use")
     print("=" * 70)
-    print("🚀 Starting MCP server on http://0.0.0.0:8000/sse")
+    if MCP_TRANSPORT in ("sse", "both"):
+        print(f"🚀 Starting MCP server (SSE) on http://0.0.0.0:{port}/sse")
+    if MCP_TRANSPORT in ("streamable-http", "both"):
+        mode = "stateless" if MCP_STATELESS_HTTP else "stateful"
+        url = f"http://0.0.0.0:{port}{MCP_HTTP_PATH}"
+        print(f"🚀 Starting MCP server (streamable HTTP, {mode}) on {url}")
+    if WORKERS > 1:
+        print(f"⚙️  Worker processes: {WORKERS} (separate connection pools per worker)")
+    if SCHEMA_CACHE_TTL > 0 or RESULT_CACHE_TTL > 0:
+        ttls = f"schema {SCHEMA_CACHE_TTL:g}s, results {RESULT_CACHE_TTL:g}s"
+        print(f"🗄️  Shared cache: {SHARED_CACHE.path} ({ttls})")
+    encodings = ", ".join(supported_encodings())
+    print(f"🗜️  Compressing responses >= {COMPRESSION_MIN_BYTES} bytes ({encodings})")
+    print(f"📈 Prometheus metrics on http://0.0.0.0:{port}/metrics")
     print("=" * 70)
 
-    # Run with SSE transport for HTTP access
-    mcp.run(transport="sse", port=8000, host="0.0.0.0")
+    if WORKERS > 1:
+        # Workers write metric samples to files that /metrics aggregates
+        metrics_dir = os.getenv("PROMETHEUS_MULTIPROC_DIR")
+        if metrics_dir:
+            os.makedirs(metrics_dir, exist_ok=True)
+            for name in os.listdir(metrics_dir):
+                if name.endswith(".db"):
+                    os.remove(os.path.join(metrics_dir, name))
+        else:
+            os.environ["PROMETHEUS_MULTIPROC_DIR"] = tempfile.mkdtemp(prefix="mcp-hub-metrics-")
+
+        # Workers import the app factory themselves (spawned processes)
+        uvicorn.run("server:create_app", factory=True, workers=WORKERS, host="0.0.0.0", port=port)
+    else:
+        uvicorn.run(create_app(), host="0.0.0.0", port=port)
@@ -0,0 +1,21 @@
+"""Make the modules in src/ importable the same way server.py imports them."""
+
+import importlib
+import os
+import sys
+
+import pytest
+
+ROOT = os.path.dirname(os.path.dirname(__file__))
+sys.path.insert(0, os.path.join(ROOT, "src"))
+sys.path.insert(0, os.path.join(ROOT, "benchmarks"))
+
+
+@pytest.fixture(scope="session")
+def server():
+    """The hub's server module, with every backend routed to benchmarks/fakes.py."""
+    fakes = importlib.import_module("fakes")
+    fakes.CONFIG.latency_ms = 0
+    fakes.CONFIG.rows = 10
+    fakes.install()
+    return importlib.import_module("server")
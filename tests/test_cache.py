@@ -0,0 +1,114 @@
+"""Tests for the shared SQLite cache and the cached() decorator."""
+
+import sqlite3
+
+import pytest
+
+import cache
+from cache import SharedCache, backend_identity, cached
+
+
+@pytest.fixture
+def shared(tmp_path, monkeypatch):
+    """A fresh SharedCache in place of the module-level one."""
+    store = SharedCache(str(tmp_path / "cache.sqlite3"))
+    monkeypatch.setattr(cache, "SHARED_CACHE", store)
+    return store
+
+
+def counting_tool(result=None):
+    """A fake postgres tool that records its calls."""
+    calls = []
+
+    def postgres_list_tables(schema: str = "public") -> dict:
+        calls.append(schema)
+        return result if result is not None else {"success": True, "tables": [schema]}
+
+    return postgres_list_tables, calls
+
+
+def test_hits_are_marked_cached(shared):
+    tool, calls = counting_tool()
+    tool = cached(60, "postgres")(tool)
+    assert tool() == {"success": True, "tables": ["public"]}
+    assert tool() == {"success": True, "tables": ["public"], "cached": True}
+    assert calls == ["public"]
+
+
+def test_default_arguments_share_an_entry(shared):
+    tool, calls = counting_tool()
+    tool = cached(60, "postgres")(tool)
+    tool()
+    tool(schema="public")
+    tool("public")
+    assert calls == ["public"]
+    tool("other")
+    assert calls == ["public", "other"]
+
+
+def test_key_includes_backend_identity(shared, monkeypatch):
+    monkeypatch.setenv("POSTGRES_DB", "one")
+    first = backend_identity("postgres")
+    tool, calls = counting_tool()
+    cached(60, "postgres")(tool)()
+
+    monkeypatch.setenv("POSTGRES_DB", "two")
+    assert backend_identity("postgres") != first
+    cached(60, "postgres")(tool)()
+    assert calls == ["public", "public"]
+
+
+def test_entries_expire(shared, monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(cache.time, "time", lambda: now[0])
+    tool, calls = counting_tool()
+    tool = cached(10, "postgres")(tool)
+    tool()
+    now[0] += 9
+    assert tool()["cached"] is True
+    now[0] += 2
+    assert "cached" not in tool()
+    assert calls == ["public", "public"]
+
+
+def test_failures_are_not_cached(shared):
+    tool, calls = counting_tool({"success": False, "error": "boom"})
+    tool = cached(60, "postgres")(tool)
+    tool()
+    tool()
+    assert calls == ["public", "public"]
+
+
+def test_zero_ttl_returns_the_function_unchanged():
+    tool, _ = counting_tool()
+    assert cached(0, "postgres")(tool) is tool
+
+
+def test_broken_cache_does_not_break_the_tool(tmp_path, monkeypatch):
+    monkeypatch.setattr(cache, "SHARED_CACHE", SharedCache(str(tmp_path)))  # a directory
+    tool, calls = counting_tool()
+    tool = cached(60, "postgres")(tool)
+    assert tool() == {"success": True, "tables": ["public"]}
+    assert calls == ["public"]
+
+
+def test_invalidate_escapes_like_wildcards(shared):
+    for key in ("a_b:1", "axb:1", "a%b:1", "a%bc:1", "a\\b:1"):
+        shared.set(key, {"key": key}, 60)
+    assert shared.invalidate("a_b:") == 1
+    assert shared.get("axb:1") is not None
+    assert shared.invalidate("a%b:") == 1
+    assert shared.get("a%bc:1") is not None
+    assert shared.invalidate("a\\b") == 1
+    assert shared.invalidate() == 2
+
+
+def test_create_database_survives_cache_errors(server, monkeypatch):
+    class BrokenCache:
+        def invalidate(self, prefix=""):
+            raise sqlite3.OperationalError("database is locked")
+
+    monkeypatch.setattr(server, "SCHEMA_CACHE_TTL", 60)
+    monkeypatch.setattr(server, "SHARED_CACHE", BrokenCache())
+    result = server.postgres_create_database("cache_test_db")
+    assert result["success"] is True
@@ -0,0 +1,119 @@
+"""Tests for Accept-Encoding negotiation and the compression middleware."""
+
+import asyncio
+import gzip
+
+import pytest
+
+import compression
+from compression import CompressionMiddleware, negotiate_encoding
+
+BODY = b'{"rows": [' + b'{"id": 1, "name": "x"}, ' * 200 + b"]}"
+
+
+@pytest.fixture
+def gzip_only(monkeypatch):
+    monkeypatch.setattr(compression, "zstandard", None)
+
+
+@pytest.mark.parametrize(
+    "header, expected",
+    [
+        ("gzip", "gzip"),
+        ("gzip, deflate, br", "gzip"),
+        ("deflate", None),
+        ("", None),
+        ("*", "gzip"),
+        ("gzip;q=0", None),
+        ("gzip;q=0, *", None),
+        ("*;q=0", None),
+        ("gzip;q=0.5", "gzip"),
+        ("GZIP", "gzip"),
+        ("gzip;q=abc", None),
+    ],
+)
+def test_negotiate_encoding(gzip_only, header, expected):
+    assert negotiate_encoding(header) == expected
+
+
+def test_negotiate_prefers_zstd_when_available():
+    if compression.zstandard is None:
+        pytest.skip("zstandard is not installed")
+    assert negotiate_encoding("gzip, zstd") == "zstd"
+    assert negotiate_encoding("gzip, zstd;q=0") == "gzip"
+
+
+def run(app, accept_encoding="gzip"):
+    """Send one GET through CompressionMiddleware(app); return (start message, body)."""
+    messages = []
+
+    async def receive():
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        messages.append(message)
+
+    scope = {"type": "http", "headers": [(b"accept-encoding", accept_encoding.encode())]}
+    asyncio.run(CompressionMiddleware(app, minimum_size=1024)(scope, receive, send))
+    body = b"".join(m.get("body", b"") for m in messages[1:])
+    return messages[0], body
+
+
+def make_app(body, content_type=b"application/json", extra_headers=(), chunks=1):
+    async def app(scope, receive, send):
+        headers = [(b"content-type", content_type), *extra_headers]
+        await send({"type": "http.response.start", "status": 200, "headers": headers})
+        size = -(-len(body) // chunks)
+        for i in range(chunks):
+            part = body[i * size : (i + 1) * size]
+            await send({"type": "http.response.body", "body": part, "more_body": i < chunks - 1})
+
+    return app
+
+
+def header(start, name):
+    return dict(start["headers"]).get(name)
+
+
+@pytest.mark.parametrize("chunks", [1, 3])
+def test_compresses_large_json(gzip_only, chunks):
+    start, body = run(make_app(BODY, chunks=chunks))
+    assert header(start, b"content-encoding") == b"gzip"
+    assert header(start, b"content-length") == str(len(body)).encode()
+    assert header(start, b"vary") == b"Accept-Encoding"
+    assert gzip.decompress(body) == BODY
+
+
+def test_small_responses_are_not_compressed(gzip_only):
+    start, body = run(make_app(b'{"ok": true}'))
+    assert header(start, b"content-encoding") is None
+    assert body == b'{"ok": true}'
+
+
+def test_no_accepted_encoding_passes_through(gzip_only):
+    start, body = run(make_app(BODY), accept_encoding="br")
+    assert header(start, b"content-encoding") is None
+    assert body == BODY
+
+
+def test_event_streams_pass_through(gzip_only):
+    start, body = run(make_app(BODY, content_type=b"text/event-stream", chunks=3))
+    assert header(start, b"content-encoding") is None
+    assert body == BODY
+
+
+def test_already_encoded_responses_pass_through(gzip_only):
+    encoded = gzip.compress(BODY)
+    app = make_app(encoded, extra_headers=[(b"content-encoding", b"gzip")])
+    start, body = run(app)
+    assert body == encoded
+
+
+def test_non_http_scopes_pass_through():
+    calls = []
+
+    async def app(scope, receive, send):
+        calls.append(scope["type"])
+
+    asyncio.run(CompressionMiddleware(app)({"type": "lifespan"}, None, None))
+    assert calls == ["lifespan"]
@@ -0,0 +1,134 @@
+"""Tests for the federated hash join."""
+
+from itertools import chain
+
+import pytest
+
+from federation import HashJoin, merge_rows, pick_build_side, row_key
+
+USERS = [
+    {"id": 1, "name": "ada"},
+    {"id": 2, "name": "bob"},
+    {"id": 3, "name": "cy"},
+    {"id": None, "name": "nobody"},
+]
+ORDERS = [
+    {"user_id": 1, "total": 10},
+    {"user_id": 1, "total": 20},
+    {"user_id": 2, "total": 5},
+    {"user_id": 4, "total": 7},
+    {"user_id": None, "total": 1},
+]
+
+
+def join(left, right, left_keys, right_keys, build_side="left", **kwargs):
+    """Run a HashJoin of left and right rows and return the joined rows, sorted."""
+    build, probe = (left, right) if build_side == "left" else (right, left)
+    build_keys, probe_keys = (
+        (left_keys, right_keys) if build_side == "left" else (right_keys, left_keys)
+    )
+    hash_join = HashJoin(build_keys, probe_keys, build_side=build_side, **kwargs)
+    try:
+        hash_join.add(build)
+        rows = list(chain(hash_join.probe(probe), hash_join.finish()))
+        return sorted(rows, key=lambda r: sorted((k, str(v)) for k, v in r.items())), hash_join
+    finally:
+        hash_join.close()
+
+
+def expected(join_type):
+    rows = [
+        {"id": 1, "name": "ada", "user_id": 1, "total": 10},
+        {"id": 1, "name": "ada", "user_id": 1, "total": 20},
+        {"id": 2, "name": "bob", "user_id": 2, "total": 5},
+    ]
+    if join_type == "left":
+        rows += [{"id": 3, "name": "cy"}, {"id": None, "name": "nobody"}]
+    return sorted(rows, key=lambda r: sorted((k, str(v)) for k, v in r.items()))
+
+
+@pytest.mark.parametrize("join_type", ["inner", "left"])
+@pytest.mark.parametrize("build_side", ["left", "right"])
+@pytest.mark.parametrize("memory_limit", [64 * 2**20, 1])
+def test_hash_join(join_type, build_side, memory_limit):
+    rows, hash_join = join(
+        USERS,
+        ORDERS,
+        ["id"],
+        ["user_id"],
+        build_side=build_side,
+        join_type=join_type,
+        memory_limit=memory_limit,
+        partitions=4,
+    )
+    assert rows == expected(join_type)
+    assert hash_join.spilled == (memory_limit == 1)
+
+
+def test_null_keys_never_match():
+    rows, _ = join([{"k": None, "a": 1}], [{"k": None, "b": 2}], ["k"], ["k"])
+    assert rows == []
+
+
+def test_composite_keys():
+    left = [{"org": 1, "user": 1, "a": "x"}, {"org": 1, "user": 2, "a": "y"}]
+    right = [{"org": 1, "user": 2, "b": "z"}, {"org": 2, "user": 1, "b": "w"}]
+    for memory_limit in (64 * 2**20, 1):
+        rows, _ = join(left, right, ["org", "user"], ["org", "user"], memory_limit=memory_limit)
+        assert rows == [{"org": 1, "user": 2, "a": "y", "org_right": 1, "user_right": 2, "b": "z"}]
+
+
+def test_missing_key_column():
+    with pytest.raises(ValueError):
+        row_key({"id": 1}, ["user_id"])
+
+
+def test_merge_rows_suffixes_clashing_columns():
+    assert merge_rows({"id": 1, "a": 1}, {"id": 2, "b": 2}) == {
+        "id": 1,
+        "a": 1,
+        "id_right": 2,
+        "b": 2,
+    }
+    assert merge_rows({"id": 1}, None) == {"id": 1}
+
+
+def test_invalid_join_type():
+    with pytest.raises(ValueError):
+        HashJoin(["id"], ["id"], join_type="outer")
+
+
+@pytest.mark.parametrize("memory_limit", [64 * 2**20, 1])
+def test_key_batches_are_distinct_and_bounded(memory_limit):
+    rows = [{"id": i % 50} for i in range(200)] + [{"id": None}]
+    hash_join = HashJoin(["id"], ["id"], join_type="left", memory_limit=memory_limit)
+    try:
+        hash_join.add(rows)
+        batches = list(hash_join.key_batches(7))
+    finally:
+        hash_join.close()
+    keys = [key for batch in batches for key in batch]
+    assert sorted(keys) == [(i,) for i in range(50)]
+    assert all(0 < len(batch) <= 7 for batch in batches)
+
+
+def test_pick_build_side_prefers_the_shorter_stream():
+    small = [[{"id": 1}]]
+    large = [[{"id": i}] for i in range(10)]
+    side, build, probe = pick_build_side(large, small, memory_limit=64 * 2**20)
+    assert side == "right"
+    assert list(build) == [{"id": 1}]
+    assert len(list(probe)) == 10
+
+    side, build, _ = pick_build_side(small, large, memory_limit=64 * 2**20)
+    assert side == "left"
+    assert list(build) == [{"id": 1}]
+
+
+def test_pick_build_side_falls_back_to_left_past_memory_limit():
+    left = ([{"id": i, "pad": "x" * 100}] for i in range(100))
+    right = ([{"id": i, "pad": "x" * 100}] for i in range(100))
+    side, build, probe = pick_build_side(left, right, memory_limit=1000)
+    assert side == "left"
+    assert len(list(build)) == 100
+    assert len(list(probe)) == 100
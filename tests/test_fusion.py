@@ -0,0 +1,40 @@
+"""Tests for rank fusion (hybrid_search)."""
+
+import pytest
+
+from fusion import fuse
+
+
+def test_rrf_fusion():
+    fused = fuse(
+        {"vector": [("a", 0.9), ("b", 0.8)], "text": [("b", 3.0), ("c", 1.0)]},
+        {"vector": 1.0, "text": 1.0},
+    )
+    assert [item["id"] for item in fused] == ["b", "a", "c"]
+    assert fused[0]["ranks"] == {"vector": 2, "text": 1}
+    assert fused[0]["score"] == round(1 / 62 + 1 / 61, 6)
+    assert fused[1]["score"] == round(1 / 61, 6)
+    assert fused[2]["score"] == round(1 / 62, 6)
+
+
+def test_rrf_fusion_weights():
+    ranked = {"vector": [("a", 0.9)], "text": [("b", 3.0)]}
+    fused = fuse(ranked, {"vector": 1.0, "text": 2.0})
+    assert [item["id"] for item in fused] == ["b", "a"]
+
+
+def test_weighted_fusion_normalizes_scores():
+    ranked = {"vector": [("a", 0.9), ("b", 0.5)], "text": [("b", 30.0), ("c", 10.0)]}
+    fused = fuse(ranked, {"vector": 0.5, "text": 0.5}, method="weighted")
+    scores = {item["id"]: item["score"] for item in fused}
+    assert scores == {"a": 0.5, "b": 0.5, "c": 0.0}
+
+
+def test_weighted_fusion_single_hit_scores_one():
+    fused = fuse({"vector": [("a", 0.3)], "text": []}, {"vector": 1.0, "text": 1.0}, "weighted")
+    assert fused == [{"id": "a", "score": 1.0, "ranks": {"vector": 1}}]
+
+
+def test_fuse_rejects_unknown_method():
+    with pytest.raises(ValueError):
+        fuse({}, {}, method="borda")
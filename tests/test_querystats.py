@@ -0,0 +1,116 @@
+"""Tests for query fingerprinting and the query log."""
+
+import pytest
+
+from querystats import QueryLog, fingerprint
+
+
+def test_fingerprint_strips_literals():
+    query = "SELECT * FROM users WHERE id IN (1, 2, 3) AND name = 'bob' LIMIT 100"
+    assert fingerprint(query) == "select * from users where id in (?+) and name = ? limit ?"
+
+
+def test_fingerprint_matches_variations():
+    first = "select *  from orders where total > 10.5 and status = 'paid';"
+    second = "SELECT * FROM orders\nWHERE total > 99 AND status = 'it''s'"
+    assert fingerprint(first) == fingerprint(second)
+
+
+def test_fingerprint_strips_comments():
+    query = "SELECT 1 -- trailing\n/* block */ FROM t"
+    assert fingerprint(query) == "select ? from t"
+
+
+def test_fingerprint_keeps_postgres_quoted_identifiers():
+    query = 'SELECT "Name" FROM "Users" WHERE "Users".id = 7'
+    assert fingerprint(query, "postgres") == 'select "name" from "users" where "users".id = ?'
+
+
+def test_fingerprint_postgres_identifier_with_apostrophe():
+    query = """SELECT "it's" FROM t WHERE a = 'x'"""
+    assert fingerprint(query, "postgres") == """select "it's" from t where a = ?"""
+
+
+def test_fingerprint_postgres_distinguishes_columns():
+    first = 'SELECT "a" FROM t'
+    second = 'SELECT "b" FROM t'
+    assert fingerprint(first, "postgres") != fingerprint(second, "postgres")
+
+
+@pytest.mark.parametrize("backend", ["mysql", "neo4j"])
+def test_fingerprint_strips_double_quoted_strings(backend):
+    query = 'MATCH (n:Person) WHERE n.name = "Alice" RETURN n'
+    assert fingerprint(query, backend) == "match (n:person) where n.name = ? return n"
+
+
+def test_fingerprint_ignores_quotes_inside_comments():
+    first = "SELECT a -- it's here\nFROM t WHERE b = 'x'"
+    second = "SELECT a -- it's here\nFROM u WHERE b = 'x'"
+    assert fingerprint(first, "postgres") == "select a from t where b = ?"
+    assert fingerprint(second, "postgres") == "select a from u where b = ?"
+    assert fingerprint("SELECT a /* don't */ FROM t", "mysql") == "select a from t"
+
+
+def test_fingerprint_ignores_comment_markers_inside_quotes():
+    assert fingerprint("SELECT '--x', b FROM t") == "select ?, b from t"
+
+
+def test_fingerprint_double_slash_is_a_comment_only_in_cypher():
+    assert fingerprint('SELECT "a//b" FROM t', "postgres") == 'select "a//b" from t'
+    assert fingerprint("SELECT 1 // 2", "mysql") == "select ? // ?"
+    assert fingerprint("MATCH (n) // all nodes\nRETURN n", "neo4j") == "match (n) return n"
+
+
+def test_fingerprint_keeps_identifier_digits():
+    assert (
+        fingerprint("SELECT col1 FROM table2 WHERE x = -3") == "select col1 from table2 where x = ?"
+    )
+
+
+def test_query_log_aggregates_by_backend_and_fingerprint():
+    log = QueryLog(size=10, slow_ms=100)
+    log.record("postgres", "SELECT * FROM t WHERE id = 1", 0.01, rows=1)
+    log.record("postgres", "SELECT * FROM t WHERE id = 2", 0.2, rows=1)
+    log.record("mysql", "SELECT * FROM t WHERE id = 3", 0.01, error="boom")
+
+    top = log.top(order_by="calls")
+    assert top[0]["backend"] == "postgres"
+    assert top[0]["calls"] == 2
+    assert top[0]["rows"] == 2
+    assert [row["errors"] for row in log.top(backend="mysql")] == [1]
+    assert len(log.slow_queries()) == 1
+
+
+def test_query_log_rejects_unknown_order():
+    with pytest.raises(ValueError):
+        QueryLog().top(order_by="size")
+
+
+def test_track_records_generators_closed_early(monkeypatch):
+    import querystats
+
+    log = QueryLog()
+    monkeypatch.setattr(querystats, "QUERY_LOG", log)
+
+    def stream():
+        with querystats.track("mysql", "SELECT * FROM t") as execution:
+            for _ in range(10):
+                execution.rows += 1
+                yield execution.rows
+
+    rows = stream()
+    next(rows)
+    next(rows)
+    rows.close()
+    assert [(r["calls"], r["rows"], r["errors"]) for r in log.top()] == [(1, 2, 0)]
+
+
+def test_track_records_errors(monkeypatch):
+    import querystats
+
+    log = QueryLog()
+    monkeypatch.setattr(querystats, "QUERY_LOG", log)
+    with pytest.raises(RuntimeError):
+        with querystats.track("postgres", "SELECT 1"):
+            raise RuntimeError("boom")
+    assert log.slow_queries() == [] and log.top()[0]["errors"] == 1
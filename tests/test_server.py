@@ -0,0 +1,277 @@
+"""Tool-level tests against the in-process backend stand-ins (benchmarks/fakes.py)."""
+
+import gzip
+import json
+import threading
+
+import pytest
+
+import fakes
+
+
+@pytest.fixture
+def exhausted_mysql_pool(server, monkeypatch):
+    """A one-connection MySQL pool whose connection is held for the test's duration."""
+    monkeypatch.setattr(server, "POOL_TIMEOUT", 0.05)
+    monkeypatch.setitem(server._pool_slots, "mysql", (threading.BoundedSemaphore(1), 1))
+    with server.mysql_connection():
+        yield
+
+
+@pytest.mark.parametrize(
+    "tool, args",
+    [
+        ("mysql_query", {"sql": "SELECT * FROM t"}),
+        ("mysql_list_tables", {}),
+        ("mysql_describe_table", {"table_name": "t"}),
+    ],
+)
+def test_mysql_tools_report_pool_timeouts(server, exhausted_mysql_pool, tool, args):
+    result = getattr(server, tool)(**args)
+    assert result["success"] is False
+    assert "waiting for a mysql connection (pool size 1)" in result["error"]
+
+
+def test_mysql_pool_slot_is_released(server, monkeypatch):
+    monkeypatch.setattr(server, "POOL_TIMEOUT", 0.05)
+    monkeypatch.setitem(server._pool_slots, "mysql", (threading.BoundedSemaphore(1), 1))
+    for _ in range(3):
+        assert server.mysql_query("SELECT * FROM t")["success"] is True
+
+
+@pytest.fixture
+def slow_tool(server, monkeypatch):
+    """A read tool that blocks until the test finishes."""
+    release = threading.Event()
+
+    def slow_query() -> dict:
+        release.wait(5)
+        return {"success": True}
+
+    monkeypatch.setitem(server.TOOL_FUNCTIONS, "slow_query", slow_query)
+    yield "slow_query"
+    release.set()
+
+
+def test_multi_query_keeps_request_order(server):
+    result = server.multi_query(
+        [
+            {"tool": "mysql_query", "args": {"sql": "SELECT * FROM t"}, "id": "orders"},
+            {"tool": "postgres_query", "args": {"sql": "SELECT * FROM t", "limit": 3}},
+            {"tool": "neo4j_query", "args": {"cypher": "MATCH (n) RETURN n"}, "id": 7},
+        ]
+    )
+    assert result["success"] is True
+    assert (result["request_count"], result["ok_count"], result["failed_count"]) == (3, 3, 0)
+    items = result["results"]
+    assert [item["index"] for item in items] == [0, 1, 2]
+    assert [item["tool"] for item in items] == ["mysql_query", "postgres_query", "neo4j_query"]
+    assert [item.get("id") for item in items] == ["orders", None, 7]
+    assert all(item["status"] == "ok" and item["result"]["success"] for item in items)
+    assert len(items[1]["result"]["rows"]) == 3
+
+
+def test_multi_query_times_out_each_sub_request(server, slow_tool):
+    result = server.multi_query(
+        [
+            {"tool": slow_tool, "timeout": 0.05},
+            {"tool": "postgres_query", "args": {"sql": "SELECT * FROM t"}},
+        ]
+    )
+    slow, fast = result["results"]
+    assert slow == {
+        "index": 0,
+        "tool": slow_tool,
+        "status": "timeout",
+        "error": "No result within 0.05s",
+    }
+    assert fast["status"] == "ok"
+    assert (result["ok_count"], result["failed_count"]) == (1, 1)
+    assert result["wall_ms"] < 2000
+
+
+@pytest.mark.parametrize(
+    "request_, error",
+    [
+        (
+            {"tool": "postgres_create_database", "args": {"database_name": "x"}},
+            "Unknown or non-read-only tool: postgres_create_database",
+        ),
+        (
+            {"tool": "multi_query", "args": {"requests": []}},
+            "Unknown or non-read-only tool: multi_query",
+        ),
+        ({"tool": "postgres_query", "args": ["SELECT 1"]}, "args must be an object"),
+        ({"tool": "postgres_query", "timeout": 0}, "timeout must be a positive number of seconds"),
+        ({"tool": "postgres_query", "timeout": -1}, "timeout must be a positive number of seconds"),
+        (
+            {"tool": "postgres_query", "timeout": "soon"},
+            "timeout must be a positive number of seconds",
+        ),
+        (
+            {"tool": "postgres_query", "timeout": float("inf")},
+            "timeout must be a positive number of seconds",
+        ),
+        (
+            {"tool": "postgres_query", "timeout": float("nan")},
+            "timeout must be a positive number of seconds",
+        ),
+        ({"tool": "postgres_query", "args": {"query": "SELECT 1"}}, "unexpected keyword argument"),
+    ],
+)
+def test_multi_query_rejects_bad_sub_requests(server, request_, error):
+    result = server.multi_query([request_, {"tool": "mysql_list_tables"}])
+    assert result["success"] is True
+    item, ok = result["results"]
+    assert item["status"] == "error"
+    assert error in item["error"]
+    assert ok["status"] == "ok"
+    assert (result["ok_count"], result["failed_count"]) == (1, 1)
+
+
+def test_multi_query_rejects_non_object_requests(server):
+    result = server.multi_query(["postgres_list_tables"])
+    assert result["results"] == [{"index": 0, "status": "error", "error": "Expected an object"}]
+
+
+def test_multi_query_reports_tool_failures_as_errors(server, monkeypatch):
+    def failing_query() -> dict:
+        return {"success": False, "error": "relation does not exist"}
+
+    def raising_query() -> dict:
+        raise RuntimeError("connection reset")
+
+    monkeypatch.setitem(server.TOOL_FUNCTIONS, "failing_query", failing_query)
+    monkeypatch.setitem(server.TOOL_FUNCTIONS, "raising_query", raising_query)
+    result = server.multi_query([{"tool": "failing_query"}, {"tool": "raising_query"}])
+    failed, raised = result["results"]
+    assert failed["status"] == "error"
+    assert failed["result"] == {"success": False, "error": "relation does not exist"}
+    assert "elapsed_ms" in failed
+    assert raised == {
+        "index": 1,
+        "tool": "raising_query",
+        "status": "error",
+        "error": "connection reset",
+    }
+
+
+@pytest.mark.parametrize(
+    "requests, error",
+    [
+        ([], "requests must contain at least one sub-request"),
+        ([{"tool": "postgres_list_tables"}] * 21, "At most 20 sub-requests per call"),
+    ],
+)
+def test_multi_query_limits(server, requests, error):
+    assert server.multi_query(requests) == {"success": False, "error": error}
+
+
+def fail(*args, **kwargs):
+    raise RuntimeError("backend down")
+
+
+def test_hybrid_search_text_only_failure(server, monkeypatch):
+    monkeypatch.setattr(server, "_text_hits", fail)
+    result = server.hybrid_search("cat", "docs", "docs")
+    assert result == {
+        "success": False,
+        "error": "Text search failed",
+        "warnings": [
+            "No query_vector given: vector search skipped",
+            "text search failed: backend down",
+        ],
+    }
+
+
+def test_hybrid_search_both_failed(server, monkeypatch):
+    monkeypatch.setattr(server, "_text_hits", fail)
+    monkeypatch.setattr(server, "_vector_hits", fail)
+    result = server.hybrid_search("cat", "docs", "docs", query_vector=[0.1] * 8)
+    assert result["success"] is False
+    assert result["error"] == "Both searches failed"
+    assert result["warnings"] == [
+        "text search failed: backend down",
+        "vector search failed: backend down",
+    ]
+
+
+def test_hybrid_search_falls_back_to_the_side_that_answered(server, monkeypatch):
+    monkeypatch.setattr(server, "_vector_hits", fail)
+    result = server.hybrid_search("cat", "docs", "docs", query_vector=[0.1] * 8)
+    assert result["success"] is True
+    assert result["candidates"] == {"text": 10}
+    assert result["warnings"] == ["vector search failed: backend down"]
+
+
+@pytest.fixture
+def export_dir(server, tmp_path, monkeypatch):
+    """QDRANT_EXPORT_DIR pointed at a fresh directory inside tmp_path."""
+    path = tmp_path / "exports"
+    path.mkdir()
+    monkeypatch.setattr(server, "QDRANT_EXPORT_DIR", str(path))
+    return path
+
+
+def read_jsonl(path):
+    opener = gzip.open if str(path).endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8") as f:
+        return [json.loads(line) for line in f]
+
+
+def test_qdrant_scroll_pages_with_offsets(server):
+    first = server.qdrant_scroll("docs", limit=4)
+    assert [p["id"] for p in first["points"]] == [0, 1, 2, 3]
+    assert first["next_page_offset"] == 4
+    last = server.qdrant_scroll("docs", limit=8, offset=first["next_page_offset"])
+    assert [p["id"] for p in last["points"]] == [4, 5, 6, 7, 8, 9]
+    assert last["next_page_offset"] is None
+
+
+def test_qdrant_scroll_payload_fields(server):
+    points = server.qdrant_scroll("docs", limit=2, payload_fields=["col_0"])["points"]
+    assert [set(p["payload"]) for p in points] == [{"col_0"}, {"col_0"}]
+    points = server.qdrant_scroll("docs", limit=2, payload_fields=[])["points"]
+    assert [p["payload"] for p in points] == [None, None]
+    assert all("vector" not in p for p in points)
+
+
+@pytest.mark.parametrize("name", ["points.jsonl", "nested/dir/points.jsonl.gz"])
+def test_qdrant_scroll_exports_every_page(server, export_dir, name):
+    result = server.qdrant_scroll("docs", limit=3, export_path=name, with_vectors=True)
+    assert result["success"] is True
+    assert result["export_path"] == str(export_dir / name)
+    assert result["point_count"] == 10
+    points = read_jsonl(export_dir / name)
+    assert [p["id"] for p in points] == list(range(10))
+    assert all(len(p["vector"]) == fakes.CONFIG.vector_size for p in points)
+    assert result["bytes"] == (export_dir / name).stat().st_size
+    assert not list(export_dir.rglob("*.tmp"))
+
+
+def test_qdrant_scroll_export_continues_from_offset_up_to_max_points(server, export_dir):
+    result = server.qdrant_scroll(
+        "docs", limit=3, offset=2, max_points=5, payload_fields=[], export_path="part.jsonl"
+    )
+    assert result["point_count"] == 5
+    assert read_jsonl(export_dir / "part.jsonl") == [
+        {"id": i, "payload": None} for i in range(2, 7)
+    ]
+
+
+@pytest.mark.parametrize("name", ["../x.jsonl", "a/../../x.jsonl", "/tmp/x.jsonl", "."])
+def test_qdrant_scroll_rejects_paths_outside_the_export_dir(server, export_dir, name):
+    result = server.qdrant_scroll("docs", export_path=name)
+    assert result["success"] is False
+    assert "export_path must be a relative path inside" in result["error"]
+    assert not (export_dir.parent / "x.jsonl").exists()
+
+
+def test_qdrant_scroll_rejects_symlinks_out_of_the_export_dir(server, export_dir, tmp_path):
+    outside = tmp_path / "outside"
+    outside.mkdir()
+    (export_dir / "link").symlink_to(outside)
+    result = server.qdrant_scroll("docs", export_path="link/x.jsonl")
+    assert result["success"] is False
+    assert "export_path must be a relative path inside" in result["error"]
+    assert list(outside.iterdir()) == []